@@ -399,6 +399,10 @@ class JobApplicationAgent:
                 'processed_jobs': processed_jobs
             }
         finally:
+            # Queued sheet rows are only confirmed once they are flushed
+            if not self.sheets_tracker.flush():
+                logger.error("Some job records could not be written to Google Sheets; they stay queued for retry")
+            
             # End the session
             self.job_counter.end_session()
     
@@ -0,0 +1,69 @@
+"""
+RoleDetector stores its role matrix as float16; check that top-1 role matches float32 scoring
+"""
+import unittest
+
+import numpy as np
+
+from utils._simd_kernels import as_f32, normalize_rows, score_matrix
+
+EMBEDDING_DIM = 1536  # text-embedding-3-small
+# Per-score error bound for unit vectors stored as float16 (half an ulp at 1.0)
+FLOAT16_SCORE_ERROR = 2.0 ** -11
+
+
+def _quantized_scores(role_embs: np.ndarray, job_vec: np.ndarray) -> np.ndarray:
+    """Score the way RoleDetector does: float16 matrix, upcast to float32 per query"""
+    role_matrix = normalize_rows(role_embs).astype(np.float16)
+    return score_matrix(role_matrix.astype(np.float32, copy=False), as_f32(job_vec / np.linalg.norm(job_vec)))
+
+
+def _full_scores(role_embs: np.ndarray, job_vec: np.ndarray) -> np.ndarray:
+    return score_matrix(normalize_rows(role_embs), as_f32(job_vec / np.linalg.norm(job_vec)))
+
+
+def _row_with_cosine(rng: np.random.Generator, unit_vec: np.ndarray, cosine: float) -> np.ndarray:
+    """Unit vector whose cosine similarity with unit_vec is exactly cosine"""
+    noise = rng.standard_normal(unit_vec.shape[0])
+    noise -= noise.dot(unit_vec) * unit_vec
+    noise /= np.linalg.norm(noise)
+    return cosine * unit_vec + np.sqrt(1.0 - cosine ** 2) * noise
+
+
+class Float16RoleMatrixTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.rng = np.random.default_rng(7)
+    
+    def test_top1_matches_float32_on_random_roles(self):
+        role_embs = self.rng.standard_normal((64, EMBEDDING_DIM)).astype(np.float32)
+        
+        for _ in range(200):
+            # Jobs near a random role, like a title that paraphrases one
+            anchor = role_embs[self.rng.integers(len(role_embs))]
+            job_vec = anchor + self.rng.standard_normal(EMBEDDING_DIM) * 2.0
+            
+            quantized = _quantized_scores(role_embs, job_vec)
+            full = _full_scores(role_embs, job_vec)
+            self.assertEqual(int(np.argmax(quantized)), int(np.argmax(full)))
+            self.assertLessEqual(float(np.max(np.abs(quantized - full))), FLOAT16_SCORE_ERROR)
+    
+    def test_top1_matches_float32_on_near_ties(self):
+        for _ in range(50):
+            job_vec = self.rng.standard_normal(EMBEDDING_DIM)
+            job_vec /= np.linalg.norm(job_vec)
+            
+            # Runner-up trails by just over twice the worst-case float16 error
+            cosines = [0.80, 0.80 - 2.2 * FLOAT16_SCORE_ERROR, 0.79, 0.60, 0.30]
+            role_embs = np.stack([_row_with_cosine(self.rng, job_vec, c) for c in cosines])
+            order = self.rng.permutation(len(cosines))
+            role_embs = role_embs[order].astype(np.float32)
+            
+            quantized = _quantized_scores(role_embs, job_vec)
+            full = _full_scores(role_embs, job_vec)
+            self.assertEqual(int(np.argmax(quantized)), int(np.argmax(full)))
+            self.assertEqual(int(np.argmax(quantized)), int(np.argmin(order)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+Compiled numeric kernels for embedding similarity scoring, byte-level term matching
+and application tracking stats
+"""
+from collections import deque
+from typing import List, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    # Explicit signatures compile eagerly and cache=True persists the machine code,
+    # so the JIT cost is paid once per environment rather than once per run.
+    # Kernels are plain module-level functions (no closures) to keep the cache valid.
+
+    @njit('f4(f4[::1], f4[::1])', fastmath=True, cache=True)
+    def dot_f32(a, b):
+        s = np.float32(0.0)
+        for i in range(a.shape[0]):
+            s += a[i] * b[i]
+        return s
+
+    @njit('f4[::1](f4[:, ::1], f4[::1])', parallel=True, fastmath=True, cache=True)
+    def score_matrix(M, v):
+        n, d = M.shape
+        out = np.empty(n, dtype=np.float32)
+        for i in prange(n):
+            s = np.float32(0.0)
+            for j in range(d):
+                s += M[i, j] * v[j]
+            out[i] = s
+        return out
+
+    @njit('void(u1[::1], i4[:, ::1], i4[::1], i4[::1], u1[::1])', cache=True)
+    def dfa_scan(text, delta, out_ptr, out_ids, hits):
+        # Pure integer walk: one table lookup per byte, then flag every pattern ending here
+        state = 0
+        for i in range(text.shape[0]):
+            state = delta[state, text[i]]
+            for k in range(out_ptr[state], out_ptr[state + 1]):
+                hits[out_ids[k]] = 1
+
+    @njit('Tuple((f8, i8))(f8[::1], i8[::1], i8)', cache=True)
+    def summarize_scores(scores, saved, cutoff):
+        # Mean of the scores and how many saved times fall at or after cutoff, in one native pass each
+        total = 0.0
+        for i in range(scores.shape[0]):
+            total += scores[i]
+        recent = 0
+        for i in range(saved.shape[0]):
+            if saved[i] >= cutoff:
+                recent += 1
+        mean = total / scores.shape[0] if scores.shape[0] > 0 else 0.0
+        return mean, recent
+
+else:
+
+    def dot_f32(a: np.ndarray, b: np.ndarray) -> np.float32:
+        return np.float32(np.dot(a, b))
+
+    def score_matrix(M: np.ndarray, v: np.ndarray) -> np.ndarray:
+        return M @ v
+
+    def summarize_scores(scores: np.ndarray, saved: np.ndarray, cutoff: int) -> Tuple[float, int]:
+        mean = float(scores.mean()) if scores.shape[0] > 0 else 0.0
+        return mean, int(np.count_nonzero(saved >= cutoff))
+
+
+def as_f32(a: np.ndarray) -> np.ndarray:
+    """Return a C-contiguous float32 view/copy suitable for the kernels"""
+    return np.ascontiguousarray(a, dtype=np.float32)
+
+
+def normalize_rows(M: np.ndarray) -> np.ndarray:
+    """Unit-normalize each row of a 2D array (zero rows stay zero)"""
+    M = as_f32(M)
+    norms = np.linalg.norm(M, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return M / norms
+
+
+def build_byte_dfa(patterns: List[bytes]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compile byte patterns into a dense Aho-Corasick DFA for dfa_scan.
+    Returns (delta, out_ptr, out_ids): delta[state, byte] is the next state, and
+    out_ids[out_ptr[state]:out_ptr[state + 1]] are the pattern indices ending at state.
+    """
+    goto = [{}]
+    outputs = [[]]
+    for pattern_id, pattern in enumerate(patterns):
+        state = 0
+        for byte in pattern:
+            next_state = goto[state].get(byte)
+            if next_state is None:
+                next_state = len(goto)
+                goto[state][byte] = next_state
+                goto.append({})
+                outputs.append([])
+            state = next_state
+        outputs[state].append(pattern_id)
+    
+    # Breadth-first: a state's failure target is shallower, so its row is already final
+    delta = np.zeros((len(goto), 256), dtype=np.int32)
+    fail = [0] * len(goto)
+    queue = deque()
+    for byte, child in goto[0].items():
+        delta[0, byte] = child
+        queue.append(child)
+    
+    while queue:
+        state = queue.popleft()
+        delta[state] = delta[fail[state]]
+        outputs[state].extend(outputs[fail[state]])
+        for byte, child in goto[state].items():
+            fail[child] = int(delta[fail[state], byte])
+            delta[state, byte] = child
+            queue.append(child)
+    
+    out_ptr = np.zeros(len(goto) + 1, dtype=np.int32)
+    out_ptr[1:] = np.cumsum([len(ids) for ids in outputs])
+    out_ids = np.array([pid for ids in outputs for pid in ids], dtype=np.int32)
+    return delta, out_ptr, out_ids
@@ -6,18 +6,33 @@ import json
 import logging
 import re
 import time
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional, Any
 from pathlib import Path
 import numpy as np
 from openai import OpenAI
 from sklearn.metrics.pairwise import cosine_similarity
 from config import settings
+from utils.json_tools import write_json
+from utils._simd_kernels import dot_f32, score_matrix, as_f32, normalize_rows
 
 logger = logging.getLogger(__name__)
 
 # Simple persistent cache file for embeddings
 CACHE_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "embeddings_cache.json")
 CACHE_LOCK_RETRY = 3
+# Precomputed role matrices, one file per roles.json revision
+ROLE_MATRIX_DIR = os.path.join(os.path.dirname(__file__), "..", "data")
+
+# Process-wide copy of the cache file, loaded on first use
+_inmem_cache: Optional[Dict[str, List[float]]] = None
+
+# Large embedding requests are split into chunks and sent concurrently
+EMBEDDING_CHUNK_SIZE = 256
+EMBEDDING_MAX_WORKERS = 8
+EMBEDDING_MAX_RETRIES = 4
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
 
 # Ensure OpenAI key is provided via env var OPENAI_API_KEY
 OPENAI_KEY = os.getenv("OPENAI_API_KEY") or os.getenv("OPENAI_KEY")
@@ -43,26 +58,53 @@ def _load_cache() -> Dict[str, List[float]]:
             return {}
 
 def _save_cache(cache: Dict[str, List[float]]):
-    # naive atomic write
-    tmp = CACHE_PATH + ".tmp"
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(cache, f)
-    os.replace(tmp, CACHE_PATH)
+    # atomic write (temp file + rename)
+    write_json(CACHE_PATH, cache)
+
+def _get_inmem_cache() -> Dict[str, List[float]]:
+    """Return the in-memory embedding cache, parsing the cache file only once"""
+    global _inmem_cache
+    if _inmem_cache is None:
+        _inmem_cache = _load_cache()
+    return _inmem_cache
+
+def _request_embeddings(texts: List[str], model: str) -> List[List[float]]:
+    """Single embeddings call with exponential backoff on rate limits / server errors"""
+    delay = 1.0
+    for attempt in range(EMBEDDING_MAX_RETRIES + 1):
+        try:
+            resp = _openai_client.embeddings.create(model=model, input=texts)
+            break
+        except Exception as e:
+            status = getattr(e, "status_code", None)
+            if status not in RETRYABLE_STATUS_CODES or attempt == EMBEDDING_MAX_RETRIES:
+                raise
+            logger.warning(f"Embedding request failed with status {status}, retrying in {delay:.0f}s")
+            time.sleep(delay)
+            delay *= 2
+    
+    embs = []
+    for item in resp.data:
+        # support both object.attr and dict-style access
+        emb = getattr(item, "embedding", None)
+        if emb is None:
+            emb = item["embedding"]
+        embs.append(emb)
+    return embs
 
 def _call_openai_batch(texts: List[str], model: str = "text-embedding-3-small") -> List[List[float]]:
     # Batch request: fewer API calls and lower latency per item
     if not texts:
         return []
     try:
-        resp = _openai_client.embeddings.create(model=model, input=texts)
-        embs = []
-        for item in resp.data:
-            # support both object.attr and dict-style access
-            emb = getattr(item, "embedding", None)
-            if emb is None:
-                emb = item["embedding"]
-            embs.append(emb)
-        return embs
+        if len(texts) <= EMBEDDING_CHUNK_SIZE:
+            return _request_embeddings(texts, model)
+        
+        # Network-bound: fire chunks concurrently, map() keeps results in input order
+        chunks = [texts[i:i + EMBEDDING_CHUNK_SIZE] for i in range(0, len(texts), EMBEDDING_CHUNK_SIZE)]
+        with ThreadPoolExecutor(max_workers=min(EMBEDDING_MAX_WORKERS, len(chunks))) as executor:
+            results = executor.map(lambda chunk: _request_embeddings(chunk, model), chunks)
+            return [emb for chunk_embs in results for emb in chunk_embs]
         
     except Exception as e:
         logger.error(f"OpenAI API call error: {e}")
@@ -70,7 +112,7 @@ def _call_openai_batch(texts: List[str], model: str = "text-embedding-3-small")
 
 def get_embedding(text: str, model: str = "text-embedding-3-small") -> np.ndarray:
     text_key = text.strip()
-    cache = _load_cache()
+    cache = _get_inmem_cache()
     if text_key in cache:
         return np.array(cache[text_key], dtype=np.float32)
     # Request and store
@@ -80,7 +122,7 @@ def get_embedding(text: str, model: str = "text-embedding-3-small") -> np.ndarra
     return np.array(embedding, dtype=np.float32)
 
 def get_embeddings_batch(texts: List[str], model: str = "text-embedding-3-small") -> List[np.ndarray]:
-    cache = _load_cache()
+    cache = _get_inmem_cache()
     results: List[np.ndarray] = []
     to_request: List[str] = []
     idx_map: Dict[int, int] = {}  # index in original -> index in to_request
@@ -100,6 +142,7 @@ def get_embeddings_batch(texts: List[str], model: str = "text-embedding-3-small"
             emb = embeddings[req_idx]
             cache[to_request[req_idx]] = emb
             results[orig_idx] = np.array(emb, dtype=np.float32)
+        # only persist when something new was fetched; pure cache hits never touch disk
         _save_cache(cache)
 
     # results should be fully populated
@@ -108,10 +151,14 @@ def get_embeddings_batch(texts: List[str], model: str = "text-embedding-3-small"
 def cosine_sim(a: np.ndarray, b: np.ndarray) -> float:
     if a is None or b is None:
         return 0.0
-    denom = (np.linalg.norm(a) * np.linalg.norm(b))
+    a = as_f32(a)
+    b = as_f32(b)
+    if a.shape != b.shape:
+        raise ValueError(f"shapes {a.shape} and {b.shape} not aligned")
+    denom = np.sqrt(dot_f32(a, a) * dot_f32(b, b))
     if denom == 0:
         return 0.0
-    return float(np.dot(a, b) / denom)
+    return float(dot_f32(a, b) / denom)
 
 
 class RoleDetector:
@@ -125,6 +172,8 @@ class RoleDetector:
         self.roles: List[str] = []
         self.roles_data: Dict[str, List[str]] = {}  # category -> variations mapping
         self._role_embeddings: List[np.ndarray] = []
+        self._role_matrix: Optional[np.ndarray] = None  # unit-normalized (R, D) float16 stack of role embeddings
+        self._role_vocab: frozenset = frozenset()  # normalized tokens from every category/variation
         self._load_roles_and_embeddings()
 
     def _load_roles_and_embeddings(self):
@@ -134,6 +183,8 @@ class RoleDetector:
             self.roles = []
             self.roles_data = {}
             self._role_embeddings = []
+            self._role_matrix = None
+            self._role_vocab = frozenset()
             return
         
         try:
@@ -174,37 +225,48 @@ class RoleDetector:
                 self.roles = []
                 self.roles_data = {}
                 self._role_embeddings = []
+                self._role_matrix = None
+                self._role_vocab = frozenset()
                 return
 
             self.roles = canonical_roles
+            self._role_vocab = frozenset(
+                word
+                for group in alias_groups
+                for text in group
+                for word in self._normalize_text(text).split()
+                if len(word) >= 2
+            )
             if not self.roles:
                 self._role_embeddings = []
+                self._role_matrix = None
                 return
 
+            # Reuse the matrix from a previous run when roles.json is unchanged
+            matrix_path = self._role_matrix_path()
+            cached_matrix = self._load_role_matrix(matrix_path)
+            if cached_matrix is not None:
+                self._role_matrix = cached_matrix
+                self._role_embeddings = list(cached_matrix.astype(np.float32))
+                logger.info(f"Loaded {len(self.roles)} role categories from {matrix_path}")
+                return
+            
             # Flatten all unique texts to request embeddings in batches (cache-friendly)
-            all_texts = []
-            group_indices = []  # for each canonical, indices into all_texts
-            for group in alias_groups:
-                indices = []
-                for t in group:
-                    indices.append(len(all_texts))
-                    all_texts.append(t)
-                group_indices.append(indices)
-
-            all_embs = get_embeddings_batch(all_texts) if all_texts else []
+            # Each group occupies a contiguous slice of all_texts starting at group_starts[i]
+            all_texts = [t for group in alias_groups for t in group]
+            group_sizes = np.array([len(group) for group in alias_groups], dtype=np.int64)
+            group_starts = np.concatenate(([0], np.cumsum(group_sizes)[:-1]))
+
+            all_embs = get_embeddings_batch(all_texts)
             
-            # For each canonical role, average embeddings of its group
-            role_embs = []
-            for indices in group_indices:
-                parts = [all_embs[i] for i in indices]
-                if parts:
-                    stacked = np.stack(parts, axis=0)
-                    avg = np.mean(stacked, axis=0)
-                    role_embs.append(avg)
-                else:
-                    role_embs.append(np.zeros((len(all_embs[0]) if all_embs else 1536,), dtype=np.float32))
+            # For each canonical role, average embeddings of its group (segment mean in one reduction)
+            flat = np.stack(all_embs, axis=0)
+            role_embs = np.add.reduceat(flat, group_starts, axis=0) / group_sizes[:, None].astype(np.float32)
 
-            self._role_embeddings = role_embs
+            self._role_embeddings = list(role_embs)
+            # float16 halves the memory traffic of the scoring pass; cosine ranking is unaffected
+            self._role_matrix = normalize_rows(role_embs).astype(np.float16)
+            self._save_role_matrix(matrix_path)
 
             logger.info(f"Loaded {len(self.roles)} role categories with keyword matching enabled")
 
@@ -213,6 +275,37 @@ class RoleDetector:
             self.roles = []
             self.roles_data = {}
             self._role_embeddings = []
+            self._role_matrix = None
+            self._role_vocab = frozenset()
+
+    def _role_matrix_path(self) -> str:
+        """Path of the persisted role matrix for the current roles.json contents"""
+        roles_hash = hashlib.sha1(Path(self.roles_path).read_bytes()).hexdigest()[:16]
+        return os.path.join(ROLE_MATRIX_DIR, f"role_matrix_{roles_hash}.npz")
+
+    def _load_role_matrix(self, matrix_path: str) -> Optional[np.ndarray]:
+        """Load a persisted role matrix if it exists and matches the current roles"""
+        if not os.path.exists(matrix_path):
+            return None
+        try:
+            with np.load(matrix_path, allow_pickle=False) as data:
+                if data["roles"].tolist() != self.roles:
+                    return None
+                return data["matrix"].astype(np.float16, copy=False)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable role matrix {matrix_path}: {e}")
+            return None
+
+    def _save_role_matrix(self, matrix_path: str):
+        """Persist the role matrix so later runs skip the embedding requests"""
+        try:
+            os.makedirs(os.path.dirname(matrix_path), exist_ok=True)
+            tmp_path = matrix_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                np.savez_compressed(f, roles=np.array(self.roles), matrix=self._role_matrix)
+            os.replace(tmp_path, matrix_path)
+        except Exception as e:
+            logger.warning(f"Could not persist role matrix: {e}")
 
     def _normalize_text(self, text: str) -> str:
         """Normalize text for better matching"""
@@ -292,18 +385,30 @@ class RoleDetector:
         
         return None
 
+    def _shares_role_vocab(self, job_title: str) -> bool:
+        """Cheap prefilter: a title sharing no word with any role is not worth an API call"""
+        title_words = {w for w in self._normalize_text(job_title).split() if len(w) >= 2}
+        return not title_words.isdisjoint(self._role_vocab)
+
+    def _embedding_text(self, job_title: str, job_description: str = "") -> str:
+        """Combine title and relevant parts of description for better context"""
+        if not job_description:
+            return job_title
+        # Extract first paragraph or first 200 chars of description for context
+        desc_snippet = job_description.split('\n')[0][:200]
+        return f"{job_title} {desc_snippet}"
+    
     def _embedding_match(self, job_title: str, job_description: str = "") -> Optional[Tuple[str, str, float]]:
         """
         Try to match job title using embedding similarity (API CALL)
         Returns (category, variation, score) if match found, None otherwise
         """
         
-        # Combine title and relevant parts of description for better context
-        text_to_embed = job_title
-        if job_description:
-            # Extract first paragraph or first 200 chars of description for context
-            desc_snippet = job_description.split('\n')[0][:200]
-            text_to_embed = f"{job_title} {desc_snippet}"
+        if not self._shares_role_vocab(job_title):
+            logger.debug(f"Skipping embedding for '{job_title}': no words in common with any role")
+            return None
+        
+        text_to_embed = self._embedding_text(job_title, job_description)
         
         try:
             # Get embedding for job text (API CALL)
@@ -313,12 +418,15 @@ class RoleDetector:
             best_idx = -1
             best_score = -1.0
             
-            # Compare against all pre-computed role embeddings
-            for i, role_emb in enumerate(self._role_embeddings):
-                score = cosine_sim(job_emb, role_emb)
-                if score > best_score:
-                    best_score = score
-                    best_idx = i
+            # Score against all pre-computed role embeddings in one pass
+            # (rows are unit-normalized, so the dot product is the cosine similarity)
+            job_vec = as_f32(job_emb)
+            job_norm = np.linalg.norm(job_vec)
+            if self._role_matrix is not None and job_norm > 0:
+                role_matrix = self._role_matrix.astype(np.float32, copy=False)
+                scores = score_matrix(role_matrix, as_f32(job_vec / job_norm))
+                best_idx = int(np.argmax(scores))
+                best_score = float(scores[best_idx])
             
             # Check if similarity meets threshold
             if best_idx >= 0 and best_score >= self.similarity_threshold:
@@ -380,6 +488,66 @@ class RoleDetector:
         detection_metadata['method_used'] = 'none'
         return "Unknown", "Unknown", detection_metadata
 
+    def detect_roles_bulk(self, jobs: List[Tuple[str, str]]) -> List[tuple]:
+        """
+        Detect roles for many (title, description) pairs at once
+        Same per-job results as detect_role, but all keyword misses share one
+        embeddings request and one matrix product against the role matrix.
+        """
+        
+        results: List[Optional[tuple]] = [None] * len(jobs)
+        pending: List[int] = []
+        
+        for i, (title, _) in enumerate(jobs):
+            detection_metadata = {
+                'job_title': title,
+                'method_used': None,
+                'confidence_score': 0.0,
+                'processing_steps': ['keyword_matching']
+            }
+            keyword_result = self._keyword_match(title)
+            if keyword_result:
+                category, variation = keyword_result
+                detection_metadata['method_used'] = 'keyword'
+                detection_metadata['confidence_score'] = 1.0
+                results[i] = (category, variation, detection_metadata)
+            else:
+                detection_metadata['processing_steps'].append('embedding_matching')
+                results[i] = ("Unknown", "Unknown", detection_metadata)
+                if self._shares_role_vocab(title):
+                    pending.append(i)
+        
+        if pending and self._role_matrix is not None:
+            try:
+                texts = [self._embedding_text(*jobs[i]) for i in pending]
+                J = normalize_rows(np.stack(get_embeddings_batch(texts), axis=0))
+                role_matrix = self._role_matrix.astype(np.float32, copy=False)
+                
+                # (k, D) x (D, R) -> (k, R) cosine matrix in a single BLAS call
+                if role_matrix.shape[0] > 1024:
+                    S = np.einsum('kd,rd->kr', J, role_matrix, optimize=True)
+                else:
+                    S = J @ role_matrix.T
+                best = S.argmax(axis=1)
+                best_scores = S[np.arange(len(pending)), best]
+                
+                for i, idx, score in zip(pending, best.tolist(), best_scores.tolist()):
+                    if score >= self.similarity_threshold:
+                        category = self.roles[idx]
+                        metadata = results[i][2]
+                        metadata['method_used'] = 'embedding'
+                        metadata['confidence_score'] = score
+                        results[i] = (category, category, metadata)
+            except Exception as e:
+                logger.error(f"Error in bulk embedding matching: {e}")
+        
+        for _, _, metadata in results:
+            if metadata['method_used'] is None:
+                metadata['method_used'] = 'none'
+        
+        logger.info(f"Bulk role detection: {len(jobs)} jobs, {len(pending)} sent to embeddings")
+        return results
+    
     def get_role_categories(self) -> List[str]:
         """Get list of available role categories"""
         return self.roles.copy()
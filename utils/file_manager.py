@@ -2,16 +2,28 @@
 Local file management for job application documents
 """
 import os
+import re
 import json
 import logging
-import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 from config import settings
+from utils.json_tools import write_json
 
 logger = logging.getLogger(__name__)
 
+# Extracted base resume text keyed by (path, mtime, size) so edits invalidate entries
+_RESUME_TEXT_CACHE: Dict[Tuple[str, float, int], str] = {}
+
+# Filesystem-unsafe characters (and spaces) all map to '_' in one translate pass
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?* '})
+_UNDERSCORE_RUN_RE = re.compile(r'_+')
+
+# Folder deletion and size scans are syscall-bound, so threads overlap well
+IO_MAX_WORKERS = 8
+
 class LocalFileManager:
     """Manages local file operations for job applications"""
     
@@ -20,6 +32,9 @@ class LocalFileManager:
         self.base_resumes_dir = Path(settings.BASE_RESUMES_DIR)
         self.debug_dir = Path(settings.DEBUG_DATA_DIR) if settings.SAVE_DEBUG_DATA else None
         
+        # (directory mtime, {category: path}) - rebuilt when files are added/removed
+        self._base_resumes_index: Optional[Tuple[float, Dict[str, Path]]] = None
+        
         # Ensure directories exist
         self._ensure_directories()
     
@@ -52,20 +67,12 @@ class LocalFileManager:
     
     def _sanitize_folder_name(self, name: str) -> str:
         """Sanitize folder name to be filesystem-safe"""
-        # Replace invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            name = name.replace(char, '_')
-        
-        # Replace spaces and multiple underscores
-        name = name.replace(' ', '_')
-        name = '_'.join(filter(None, name.split('_')))  # Remove empty parts
+        # Replace invalid characters and spaces, collapse repeated underscores
+        name = name.translate(_SANITIZE_TABLE)
+        name = _UNDERSCORE_RUN_RE.sub('_', name).strip('_')
         
         # Limit length
-        if len(name) > 100:
-            name = name[:100]
-        
-        return name
+        return name[:100]
     
     def save_job_details(self, job_folder: Path, job_data: Dict) -> Path:
         """Save job details as JSON file"""
@@ -84,8 +91,8 @@ class LocalFileManager:
                 }
             }
             
-            with open(job_details_file, 'w', encoding='utf-8') as f:
-                json.dump(job_data_with_metadata, f, indent=2, ensure_ascii=False)
+            # Pretty-printed since this file is meant to be read by the user
+            write_json(job_details_file, job_data_with_metadata, pretty=True)
             
             logger.info(f"Saved job details: {job_details_file}")
             return job_details_file
@@ -113,18 +120,24 @@ class LocalFileManager:
     def load_base_resume(self, role_category: str) -> Tuple[Path, str]:
         """Load base resume for a role category"""
         
-        base_resume_file = self.base_resumes_dir / f"{role_category}.docx"
+        base_resume_file = self._get_base_resumes_index().get(role_category)
         
-        if not base_resume_file.exists():
+        if base_resume_file is None:
             error_msg = f"Base resume not found for role category: {role_category}"
             logger.error(error_msg)
             raise FileNotFoundError(error_msg)
         
         try:
-            # Extract text from DOCX for processing
-            from utils.docx_tools import DocxProcessor
-            docx_processor = DocxProcessor()
-            resume_text = docx_processor.extract_text_from_docx(base_resume_file)
+            st = base_resume_file.stat()
+            cache_key = (str(base_resume_file), st.st_mtime, st.st_size)
+            resume_text = _RESUME_TEXT_CACHE.get(cache_key)
+            
+            if resume_text is None:
+                # Extract text from DOCX for processing
+                from utils.docx_tools import DocxProcessor
+                docx_processor = DocxProcessor()
+                resume_text = docx_processor.extract_text_from_docx(base_resume_file)
+                _RESUME_TEXT_CACHE[cache_key] = resume_text
             
             logger.info(f"Loaded base resume for {role_category}: {base_resume_file}")
             return base_resume_file, resume_text
@@ -136,21 +149,38 @@ class LocalFileManager:
     def get_available_base_resumes(self) -> List[str]:
         """Get list of available base resume categories"""
         
-        categories = []
-        
         try:
-            for file_path in self.base_resumes_dir.glob("*.docx"):
-                # Extract category name from filename
-                category = file_path.stem
-                categories.append(category)
+            categories = sorted(self._get_base_resumes_index().keys())
             
             logger.info(f"Found {len(categories)} base resume categories")
-            return sorted(categories)
+            return categories
             
         except Exception as e:
             logger.error(f"Error listing base resumes: {e}")
             return []
     
+    def _get_base_resumes_index(self) -> Dict[str, Path]:
+        """Map of category -> base resume path, cached until the directory changes"""
+        
+        try:
+            dir_mtime = self.base_resumes_dir.stat().st_mtime
+        except FileNotFoundError:
+            self._base_resumes_index = None
+            return {}
+        
+        if self._base_resumes_index is not None and self._base_resumes_index[0] == dir_mtime:
+            return self._base_resumes_index[1]
+        
+        index = {}
+        with os.scandir(self.base_resumes_dir) as it:
+            for entry in it:
+                if entry.name.endswith('.docx') and entry.is_file():
+                    # Category name is the filename without extension
+                    index[entry.name[:-len('.docx')]] = Path(entry.path)
+        
+        self._base_resumes_index = (dir_mtime, index)
+        return index
+    
     def save_debug_data(self, job_id: str, data_type: str, data: any) -> Optional[Path]:
         """Save debug data for analysis"""
         
@@ -165,8 +195,7 @@ class LocalFileManager:
             # Save data based on type
             if isinstance(data, (dict, list)):
                 debug_file = job_debug_dir / f"{data_type}.json"
-                with open(debug_file, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                write_json(debug_file, data)
             else:
                 debug_file = job_debug_dir / f"{data_type}.txt"
                 with open(debug_file, 'w', encoding='utf-8') as f:
@@ -189,13 +218,24 @@ class LocalFileManager:
         removed_count = 0
         
         try:
-            for folder in self.applications_dir.iterdir():
-                if folder.is_dir():
-                    # Check folder modification time
-                    if folder.stat().st_mtime < cutoff_date:
-                        shutil.rmtree(folder)
-                        removed_count += 1
-                        logger.debug(f"Removed old application folder: {folder}")
+            with os.scandir(self.applications_dir) as it:
+                # Check folder modification time (symlinked folders are never removed)
+                expired_folders = [
+                    entry.path for entry in it
+                    if entry.is_dir(follow_symlinks=False) and entry.stat().st_mtime < cutoff_date
+                ]
+            
+            if expired_folders:
+                with ThreadPoolExecutor(max_workers=min(IO_MAX_WORKERS, len(expired_folders))) as executor:
+                    futures = {executor.submit(self._fast_rmtree, folder): folder for folder in expired_folders}
+                    for future in as_completed(futures):
+                        folder = futures[future]
+                        try:
+                            future.result()
+                            removed_count += 1
+                            logger.debug(f"Removed old application folder: {folder}")
+                        except Exception as e:
+                            logger.warning(f"Error removing {folder}: {e}")
             
             if removed_count > 0:
                 logger.info(f"Cleaned up {removed_count} old application folders")
@@ -215,21 +255,28 @@ class LocalFileManager:
             if not self.applications_dir.exists():
                 return folders
             
-            for folder in self.applications_dir.iterdir():
-                if folder.is_dir():
+            with os.scandir(self.applications_dir) as it:
+                for entry in it:
+                    if not entry.is_dir():
+                        continue
+                    
+                    # DirEntry caches the stat result, so one syscall covers both times
+                    folder_stat = entry.stat()
+                    
                     # Try to load job details
-                    job_details_file = folder / settings.JOB_DETAILS_FILENAME
+                    job_details_file = Path(entry.path) / settings.JOB_DETAILS_FILENAME
+                    has_job_details = job_details_file.exists()
                     
                     folder_info = {
-                        'folder_name': folder.name,
-                        'folder_path': str(folder),
-                        'created_time': datetime.fromtimestamp(folder.stat().st_ctime),
-                        'modified_time': datetime.fromtimestamp(folder.stat().st_mtime),
-                        'has_job_details': job_details_file.exists()
+                        'folder_name': entry.name,
+                        'folder_path': entry.path,
+                        'created_time': datetime.fromtimestamp(folder_stat.st_ctime),
+                        'modified_time': datetime.fromtimestamp(folder_stat.st_mtime),
+                        'has_job_details': has_job_details
                     }
                     
                     # Add job details if available
-                    if job_details_file.exists():
+                    if has_job_details:
                         try:
                             with open(job_details_file, 'r', encoding='utf-8') as f:
                                 job_data = json.load(f)
@@ -313,17 +360,19 @@ class LocalFileManager:
         
         try:
             if self.applications_dir.exists():
+                with os.scandir(self.applications_dir) as it:
+                    folders = [entry.path for entry in it if entry.is_dir()]
+                
+                stats['total_applications'] = len(folders)
+                
+                # One scan task per application folder
                 total_size = 0
                 total_files = 0
-                
-                for folder in self.applications_dir.iterdir():
-                    if folder.is_dir():
-                        stats['total_applications'] += 1
-                        
-                        for file_path in folder.rglob('*'):
-                            if file_path.is_file():
-                                total_files += 1
-                                total_size += file_path.stat().st_size
+                if folders:
+                    with ThreadPoolExecutor(max_workers=min(IO_MAX_WORKERS, len(folders))) as executor:
+                        for folder_files, folder_size in executor.map(self._directory_usage, folders):
+                            total_files += folder_files
+                            total_size += folder_size
                 
                 stats['total_files'] = total_files
                 stats['total_size_mb'] = round(total_size / (1024 * 1024), 2)
@@ -333,6 +382,41 @@ class LocalFileManager:
         
         return stats
 
+    @staticmethod
+    def _fast_rmtree(path: str):
+        """Delete a directory tree we own; nested symlinks are unlinked, never followed"""
+        
+        # Same guard as shutil.rmtree: never walk into a tree through a link
+        if os.path.islink(path):
+            raise OSError(f"Cannot remove a directory tree through a symbolic link: {path}")
+        
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    LocalFileManager._fast_rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+        os.rmdir(path)
+
+    @staticmethod
+    def _directory_usage(path: str) -> Tuple[int, int]:
+        """Count files and total bytes under a directory (explicit scandir stack, no recursion)"""
+        
+        file_count = 0
+        total_size = 0
+        stack = [path]
+        
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        file_count += 1
+                        total_size += entry.stat().st_size
+        
+        return file_count, total_size
+
 
 # Factory function for easy access
 def create_file_manager() -> LocalFileManager:
@@ -2,56 +2,181 @@
 Enhanced location and work permit filtering for international job seekers
 """
 import re
+import sys
 import logging
-from typing import Dict, List, Tuple, Optional, NamedTuple
-from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import Callable, Dict, List, Tuple, Optional
+from dataclasses import dataclass, field
+import numpy as np
 from config import settings
+from utils._simd_kernels import NUMBA_AVAILABLE, build_byte_dfa
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    from utils._simd_kernels import dfa_scan
 
 logger = logging.getLogger(__name__)
 
-@dataclass
-class FilterDecision:
-    """Result of filtering decision"""
-    should_stop: bool
-    reason: str
-    details: Dict[str, any]
+# __slots__ dataclasses need Python 3.10+; older interpreters get regular ones
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Common country patterns (dict order is match priority)
+COUNTRY_PATTERNS = {
+    'united states': ['united states', 'usa', 'us', 'america'],
+    'united kingdom': ['united kingdom', 'uk', 'britain', 'england', 'scotland', 'wales'],
+    'canada': ['canada', 'canadian'],
+    'australia': ['australia', 'australian'],
+    'germany': ['germany', 'german', 'deutschland'],
+    'netherlands': ['netherlands', 'holland', 'dutch'],
+    'france': ['france', 'french'],
+    'singapore': ['singapore'],
+    'ireland': ['ireland', 'irish'],
+    'new zealand': ['new zealand'],
+    'switzerland': ['switzerland', 'swiss'],
+    'sweden': ['sweden', 'swedish'],
+    'norway': ['norway', 'norwegian'],
+    'denmark': ['denmark', 'danish']
+}
+
+REMOTE_INDICATORS = [
+    'remote', 'work from home', 'wfh', 'telecommute', 'distributed',
+    'anywhere', 'worldwide', 'global', 'virtual'
+]
+# One alternation, scanned once per string; anchored at a word start only, so inflections
+# like 'remotely' or 'globally' still count
+_REMOTE_RE = re.compile(r'\b(?:' + '|'.join(map(re.escape, REMOTE_INDICATORS)) + r')', re.IGNORECASE)
 
-class LocationInfo(NamedTuple):
+@dataclass(frozen=True, **_SLOTS)
+class LocationInfo:
     """Structured location information"""
     country: str
     city: str
     region: str  # state/province
     is_remote: bool
 
+def _loc_to_dict(location_info: LocationInfo) -> Dict[str, any]:
+    """Plain dict view of a LocationInfo (cheaper than dataclasses.asdict)"""
+    return {
+        'country': location_info.country,
+        'city': location_info.city,
+        'region': location_info.region,
+        'is_remote': location_info.is_remote
+    }
+
+@dataclass(frozen=True, **_SLOTS)
+class FilterDecision:
+    """Result of filtering decision"""
+    should_stop: bool
+    reason: str
+    location_info: Optional[LocationInfo] = field(default=None, repr=False)
+    visa_analysis: Optional[Dict[str, any]] = field(default=None, repr=False)
+    # Runs the full visa analysis when the decision was made without it
+    visa_analysis_factory: Optional[Callable[[], Dict[str, any]]] = field(default=None, repr=False, compare=False)
+    # Applicant country the decision was made for
+    applicant_country: str = field(default='', repr=False)
+    _details: Optional[Dict[str, any]] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def details(self) -> Dict[str, any]:
+        """Full analysis behind the decision (built on first access; most callers only need should_stop/reason)"""
+        if self._details is not None:
+            return self._details
+        
+        visa_analysis = self.visa_analysis
+        if visa_analysis is None and self.visa_analysis_factory is not None:
+            visa_analysis = self.visa_analysis_factory()
+            # Report the country the decision was made for, not whatever settings say now
+            visa_analysis['applicant_country'] = self.applicant_country
+        if self.location_info is None or visa_analysis is None:
+            details = {}
+        else:
+            details = {
+                'location_info': _loc_to_dict(self.location_info),
+                'visa_analysis': visa_analysis,
+                'filter_criteria': {
+                    'applicant_country': self.applicant_country,
+                    'restrictive_terms_found': len(visa_analysis['restrictive_indicators']),
+                    'positive_terms_found': len(visa_analysis['positive_indicators'])
+                }
+            }
+        
+        # Frozen dataclass: cache through object.__setattr__
+        object.__setattr__(self, '_details', details)
+        return details
+
+class _TermMatcher:
+    """Finds which of a fixed set of substrings occur in a text, in one pass when possible"""
+    
+    def __init__(self, patterns: Dict[str, str]):
+        # patterns: lowered substring -> value reported when it occurs
+        self.patterns = patterns
+        self._automaton = None
+        self._dfa = None
+        
+        if not patterns:
+            return
+        
+        if AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for pattern, value in patterns.items():
+                self._automaton.add_word(pattern, value)
+            self._automaton.make_automaton()
+        elif NUMBA_AVAILABLE:
+            # Same automaton as a dense byte table walked by a compiled kernel.
+            # UTF-8 is self-synchronizing, so byte matches are exactly substring matches.
+            self._values = list(patterns.values())
+            self._dfa = build_byte_dfa([pattern.encode('utf-8') for pattern in patterns])
+    
+    def find(self, text_lower: str) -> set:
+        """Return the set of values whose pattern occurs in the (already lowered) text"""
+        if self._automaton is not None:
+            return {value for _, value in self._automaton.iter(text_lower)}
+        if self._dfa is not None:
+            hits = np.zeros(len(self._values), dtype=np.uint8)
+            # bytearray gives a writable buffer (the kernel signature takes non-readonly arrays)
+            text_bytes = np.frombuffer(bytearray(text_lower, 'utf-8'), dtype=np.uint8)
+            dfa_scan(text_bytes, *self._dfa, hits)
+            return {self._values[i] for i in np.flatnonzero(hits)}
+        return {value for pattern, value in self.patterns.items() if pattern in text_lower}
+
+
+# Country table never changes, so one matcher serves every analyzer.
+# Values are (table position, display name) so min() picks the highest-priority hit.
+_COUNTRY_MATCHER = _TermMatcher({
+    pattern: (priority, country.title())
+    for priority, (country, patterns) in enumerate(COUNTRY_PATTERNS.items())
+    for pattern in patterns
+})
+
+
 class WorkPermitAnalyzer:
     """Analyzes work permit and visa sponsorship requirements"""
     
     def __init__(self):
         self.restrictive_terms = [term.lower() for term in settings.RESTRICTIVE_LOCAL_TERMS]
         self.positive_terms = [term.lower() for term in settings.POSITIVE_SPONSORSHIP_TERMS]
-        self.sponsorship_friendly_countries = [country.lower() for country in settings.SPONSORSHIP_FRIENDLY_COUNTRIES]
+        self.sponsorship_friendly_countries = frozenset(country.lower() for country in settings.SPONSORSHIP_FRIENDLY_COUNTRIES)
         self.applicant_country = settings.APPLICANT_COUNTRY.lower()
+        
+        # Term sets are fixed for the analyzer's lifetime, so build the matchers once
+        self._restrictive_matcher = _TermMatcher({term: term for term in self.restrictive_terms})
+        self._positive_matcher = _TermMatcher({term: term for term in self.positive_terms})
     
     def extract_location_info(self, location_string: str, job_description: str = "") -> LocationInfo:
         """Extract structured location information from job posting"""
-        location_lower = location_string.lower()
-        
-        # Check for remote work indicators
-        remote_indicators = [
-            'remote', 'work from home', 'wfh', 'telecommute', 'distributed',
-            'anywhere', 'worldwide', 'global', 'virtual'
-        ]
-        is_remote = any(indicator in location_lower for indicator in remote_indicators)
-        
-        # Also check job description for remote indicators
-        if job_description:
-            jd_lower = job_description.lower()
-            is_remote = is_remote or any(indicator in jd_lower for indicator in remote_indicators)
+        # Check location, then job description, for remote work indicators
+        is_remote = bool(_REMOTE_RE.search(location_string) or (job_description and _REMOTE_RE.search(job_description)))
         
-        # Extract country information
-        country = self._extract_country(location_string)
-        city = self._extract_city(location_string)
-        region = self._extract_region(location_string)
+        # Extract country information (split the location once and share the parts)
+        parts = self._split_location(location_string)
+        country = self._extract_country(location_string, parts)
+        city = self._extract_city(location_string, parts)
+        region = self._extract_region(location_string, parts)
         
         return LocationInfo(
             country=country,
@@ -60,85 +185,80 @@ class WorkPermitAnalyzer:
             is_remote=is_remote
         )
     
-    def _extract_country(self, location_string: str) -> str:
+    @staticmethod
+    def _split_location(location_string: str) -> List[str]:
+        """Comma-separated location components, stripped"""
+        return [part.strip() for part in location_string.split(',')]
+    
+    def _extract_country(self, location_string: str, parts: Optional[List[str]] = None) -> str:
         """Extract country from location string"""
         location_lower = location_string.lower()
         
-        # Common country patterns
-        country_patterns = {
-            'united states': ['united states', 'usa', 'us', 'america'],
-            'united kingdom': ['united kingdom', 'uk', 'britain', 'england', 'scotland', 'wales'],
-            'canada': ['canada', 'canadian'],
-            'australia': ['australia', 'australian'],
-            'germany': ['germany', 'german', 'deutschland'],
-            'netherlands': ['netherlands', 'holland', 'dutch'],
-            'france': ['france', 'french'],
-            'singapore': ['singapore'],
-            'ireland': ['ireland', 'irish'],
-            'new zealand': ['new zealand'],
-            'switzerland': ['switzerland', 'swiss'],
-            'sweden': ['sweden', 'swedish'],
-            'norway': ['norway', 'norwegian'],
-            'denmark': ['denmark', 'danish']
-        }
-        
-        for country, patterns in country_patterns.items():
-            if any(pattern in location_lower for pattern in patterns):
-                return country.title()
+        matched = _COUNTRY_MATCHER.find(location_lower)
+        if matched:
+            # Several countries can match; keep the table-order winner
+            return min(matched)[1]
         
         # If no specific country found, try to extract from end of location string
-        parts = location_string.split(',')
+        if parts is None:
+            parts = self._split_location(location_string)
         if len(parts) >= 2:
-            potential_country = parts[-1].strip()
-            return potential_country.title()
+            return parts[-1].title()
         
         return "Unknown"
     
-    def _extract_city(self, location_string: str) -> str:
+    def _extract_city(self, location_string: str, parts: Optional[List[str]] = None) -> str:
         """Extract city from location string"""
-        parts = [part.strip() for part in location_string.split(',')]
+        if parts is None:
+            parts = self._split_location(location_string)
         if parts:
             return parts[0].title()
         return "Unknown"
     
-    def _extract_region(self, location_string: str) -> str:
+    def _extract_region(self, location_string: str, parts: Optional[List[str]] = None) -> str:
         """Extract state/province from location string"""
-        parts = [part.strip() for part in location_string.split(',')]
+        if parts is None:
+            parts = self._split_location(location_string)
         if len(parts) >= 2:
             return parts[1].title()
         return ""
     
-    def find_restrictive_indicators(self, job_description: str) -> List[str]:
+    def find_restrictive_indicators(self, job_description: str, jd_lower: Optional[str] = None) -> List[str]:
         """Find work permit restriction indicators in job description"""
-        jd_lower = job_description.lower()
-        found_restrictions = []
-        
-        for term in self.restrictive_terms:
-            if term in jd_lower:
-                found_restrictions.append(term)
+        if jd_lower is None:
+            jd_lower = job_description.lower()
+        found = self._restrictive_matcher.find(jd_lower)
         
-        return found_restrictions
+        # Report in configuration order
+        return [term for term in self.restrictive_terms if term in found]
     
-    def find_positive_indicators(self, job_description: str) -> List[str]:
+    def find_positive_indicators(self, job_description: str, jd_lower: Optional[str] = None) -> List[str]:
         """Find visa sponsorship indicators in job description"""
-        jd_lower = job_description.lower()
-        found_positive = []
-        
-        for term in self.positive_terms:
-            if term in jd_lower:
-                found_positive.append(term)
+        if jd_lower is None:
+            jd_lower = job_description.lower()
+        found = self._positive_matcher.find(jd_lower)
         
-        return found_positive
+        # Report in configuration order
+        return [term for term in self.positive_terms if term in found]
     
     def is_sponsorship_friendly_country(self, country: str) -> bool:
         """Check if country commonly offers tech visa sponsorship"""
         return country.lower() in self.sponsorship_friendly_countries
     
-    def analyze_visa_requirements(self, job_description: str, location_info: LocationInfo) -> Dict[str, any]:
+    def is_location_always_compatible(self, location_info: LocationInfo) -> bool:
+        """Same-country and remote jobs pass whatever the description says (no term scan needed)"""
+        return location_info.is_remote or location_info.country.lower() == self.applicant_country
+    
+    def analyze_visa_requirements(self, job_description: str, location_info: LocationInfo,
+                                  jd_lower: Optional[str] = None) -> Dict[str, any]:
         """Comprehensive analysis of visa/work permit requirements"""
         
-        restrictive_indicators = self.find_restrictive_indicators(job_description)
-        positive_indicators = self.find_positive_indicators(job_description)
+        # Lowercase the description once and share it between both term scans
+        if jd_lower is None:
+            jd_lower = job_description.lower()
+        
+        restrictive_indicators = self.find_restrictive_indicators(job_description, jd_lower)
+        positive_indicators = self.find_positive_indicators(job_description, jd_lower)
         
         # Determine if local work permit is required
         required_local_permit = len(restrictive_indicators) > 0
@@ -147,9 +267,11 @@ class WorkPermitAnalyzer:
         sponsorship_offered = len(positive_indicators) > 0
         
         # Check location compatibility
-        is_same_country = location_info.country.lower() == self.applicant_country
+        job_country = location_info.country
+        country_lower = job_country.lower()
+        is_same_country = country_lower == self.applicant_country
         is_remote_friendly = location_info.is_remote
-        is_sponsorship_friendly = self.is_sponsorship_friendly_country(location_info.country)
+        is_sponsorship_friendly = country_lower in self.sponsorship_friendly_countries
         
         # Overall location compatibility logic
         location_compatible = (
@@ -169,7 +291,7 @@ class WorkPermitAnalyzer:
             'is_remote_friendly': is_remote_friendly,
             'is_sponsorship_friendly_country': is_sponsorship_friendly,
             'applicant_country': settings.APPLICANT_COUNTRY,
-            'job_country': location_info.country
+            'job_country': job_country
         }
 
 
@@ -189,6 +311,19 @@ class JobFilter:
         # Extract location information
         location_info = self.work_permit_analyzer.extract_location_info(location, job_description)
         
+        # Quick path: the description scans can't change the outcome, so defer them to details
+        if self.work_permit_analyzer.is_location_always_compatible(location_info):
+            logger.info(f"Job '{job_title}' at {company_name} passed location filter")
+            return FilterDecision(
+                should_stop=False,
+                reason="",
+                location_info=location_info,
+                visa_analysis_factory=partial(
+                    self.work_permit_analyzer.analyze_visa_requirements, job_description, location_info
+                ),
+                applicant_country=settings.APPLICANT_COUNTRY
+            )
+        
         # Analyze visa requirements
         visa_analysis = self.work_permit_analyzer.analyze_visa_requirements(job_description, location_info)
         
@@ -215,15 +350,9 @@ class JobFilter:
         return FilterDecision(
             should_stop=should_ignore,
             reason=reason,
-            details={
-                'location_info': location_info._asdict(),
-                'visa_analysis': visa_analysis,
-                'filter_criteria': {
-                    'applicant_country': settings.APPLICANT_COUNTRY,
-                    'restrictive_terms_found': len(visa_analysis['restrictive_indicators']),
-                    'positive_terms_found': len(visa_analysis['positive_indicators'])
-                }
-            }
+            location_info=location_info,
+            visa_analysis=visa_analysis,
+            applicant_country=settings.APPLICANT_COUNTRY
         )
     
     def get_filter_summary(self, job_title: str, company_name: str, location: str, 
@@ -238,7 +367,7 @@ class JobFilter:
                 'company': company_name,
                 'location': location
             },
-            'location_analysis': location_info._asdict(),
+            'location_analysis': _loc_to_dict(location_info),
             'visa_analysis': visa_analysis,
             'recommendation': 'proceed' if visa_analysis['location_compatible'] else 'ignore'
         }
@@ -250,11 +379,16 @@ def create_job_filter() -> JobFilter:
     return JobFilter()
 
 
+@lru_cache(maxsize=1)
+def _default_filter() -> JobFilter:
+    """Shared filter for the convenience helpers (settings are fixed at import time)"""
+    return create_job_filter()
+
+
 # Convenience function for quick filtering
 def check_work_permit_compatibility(job_description: str, location: str) -> FilterDecision:
     """Quick function to check work permit compatibility"""
-    job_filter = create_job_filter()
-    return job_filter.should_ignore_job("", "", location, job_description)
+    return _default_filter().should_ignore_job("", "", location, job_description)
 
 
 # Validation function for configuration
@@ -1,35 +1,100 @@
 """
 Job processing counter and limits management
 """
-import json
 import logging
+import time
 from datetime import datetime, timedelta
 from typing import Dict, Optional, List
 from pathlib import Path
-from dataclasses import dataclass, asdict
+import numpy as np
 from config import settings
+from utils.json_tools import dumps_bytes, load_json, loads, write_json
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Full processed-jobs snapshot is rewritten every N recorded jobs; the journal covers the rest
+PROCESSED_JOBS_CHECKPOINT_INTERVAL = 50
+
+# (unix time, isoformat string) of the last formatted timestamp
+_ts_cache = [0.0, ""]
+
+def _now_iso() -> str:
+    """datetime.now().isoformat(), reformatted at most twice a second"""
+    t = time.time()
+    if t - _ts_cache[0] > 0.5:
+        _ts_cache[:] = [t, datetime.fromtimestamp(t).isoformat()]
+    return _ts_cache[1]
+
+# Counter layout of JobProcessingStats._counts (the ignored_* counters are contiguous)
+STATS_COUNTERS = (
+    'total_scraped',
+    'total_processed',
+    'successful_applications',
+    'ignored_role_unknown',
+    'ignored_work_permit',
+    'ignored_low_fit',
+    'ignored_duplicate',
+)
+IGNORED_COUNTERS = slice(3, 7)
+
+class _Counter:
+    """Int attribute backed by one slot of the owner's counts array"""
+    
+    def __init__(self, index: int):
+        self.index = index
+    
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return int(instance._counts[self.index])
+    
+    def __set__(self, instance, value: int):
+        instance._counts[self.index] = value
+
 class JobProcessingStats:
     """Statistics for job processing session"""
-    total_scraped: int = 0
-    total_processed: int = 0
-    successful_applications: int = 0
-    ignored_role_unknown: int = 0
-    ignored_work_permit: int = 0
-    ignored_low_fit: int = 0
-    ignored_duplicate: int = 0
-    session_start_time: Optional[str] = None
-    session_end_time: Optional[str] = None
+    __slots__ = ('_counts', 'session_start_time', 'session_end_time')
+    
+    total_scraped = _Counter(0)
+    total_processed = _Counter(1)
+    successful_applications = _Counter(2)
+    ignored_role_unknown = _Counter(3)
+    ignored_work_permit = _Counter(4)
+    ignored_low_fit = _Counter(5)
+    ignored_duplicate = _Counter(6)
+    
+    def __init__(self, session_start_time: Optional[str] = None,
+                 session_end_time: Optional[str] = None, **counts: int):
+        self._counts = np.zeros(len(STATS_COUNTERS), dtype=np.int64)
+        self.session_start_time = session_start_time
+        self.session_end_time = session_end_time
+        for name, value in counts.items():
+            if name not in STATS_COUNTERS:
+                raise TypeError(f"Unknown stats field: {name}")
+            setattr(self, name, value)
+    
+    @property
+    def counts(self) -> np.ndarray:
+        """All counters as an int64 array in STATS_COUNTERS order (sessions stack with np.sum)"""
+        return self._counts
+    
+    @property
+    def total_ignored(self) -> int:
+        return int(self._counts[IGNORED_COUNTERS].sum())
     
     def to_dict(self) -> Dict:
-        return asdict(self)
+        data = dict(zip(STATS_COUNTERS, self._counts.tolist()))
+        data['session_start_time'] = self.session_start_time
+        data['session_end_time'] = self.session_end_time
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'JobProcessingStats':
         return cls(**data)
+    
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{key}={value!r}" for key, value in self.to_dict().items())
+        return f"JobProcessingStats({fields})"
 
 class JobCounter:
     """Manages job processing limits and tracking"""
@@ -38,26 +103,46 @@ class JobCounter:
         self.max_jobs_per_run = max_jobs_per_run or settings.MAX_JOBS_PER_RUN
         self.stats = JobProcessingStats()
         self.processed_jobs_file = Path(settings.PROCESSED_JOBS_FILE)
-        self.session_jobs: List[str] = []  # Track job IDs processed this session
+        # Append-only log of records written since the last snapshot
+        self.processed_jobs_journal = self.processed_jobs_file.with_suffix('.jsonl')
+        self._journal = None
+        self._journal_entries = 0
+        self._session_job_count = 0  # Job IDs themselves go to session_jobs_file
+        self.session_jobs_file: Optional[Path] = None  # JSONL of this session's job IDs
+        self._session_jobs_log = None
         self.duplicate_check_data: Dict[str, Dict] = {}
         
+        # Lookup indexes over duplicate_check_data (kept in sync by _index_job)
+        self._by_link: Dict[str, str] = {}  # job_link -> job_id
+        self._by_sig: Dict[str, float] = {}  # title_company signature -> newest processed epoch
+        self._recent_cutoff_epoch = 0.0  # set per session; "recent" means processed after this
+        
         # Ensure directory exists
         self.processed_jobs_file.parent.mkdir(parents=True, exist_ok=True)
         
         # Load existing processed jobs for duplicate detection
         self._load_processed_jobs()
+        self._rebuild_indexes()
         
         # Initialize session
         self.start_session()
     
     def start_session(self):
         """Start a new processing session"""
-        self.stats.session_start_time = datetime.now().isoformat()
+        session_start = datetime.now()
+        self.stats.session_start_time = session_start.isoformat()
+        self._recent_cutoff_epoch = (session_start - timedelta(days=30)).timestamp()
+        # Microseconds keep sessions started within the same second from sharing a log
+        self.session_jobs_file = self.processed_jobs_file.parent / f"session_jobs_{session_start.strftime('%Y%m%d_%H%M%S_%f')}.jsonl"
+        if self._session_jobs_log is not None:
+            self._session_jobs_log.close()
+            self._session_jobs_log = None
         logger.info(f"Started job processing session with limit: {self.max_jobs_per_run}")
     
     def end_session(self):
         """End the current processing session"""
         self.stats.session_end_time = datetime.now().isoformat()
+        self._save_processed_jobs()
         self._save_session_summary()
         logger.info(f"Ended job processing session. Successful applications: {self.stats.successful_applications}")
     
@@ -65,28 +150,117 @@ class JobCounter:
         """Load previously processed jobs for duplicate detection"""
         try:
             if self.processed_jobs_file.exists():
-                with open(self.processed_jobs_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    self.duplicate_check_data = data.get('processed_jobs', {})
-                    logger.info(f"Loaded {len(self.duplicate_check_data)} previously processed jobs")
+                data = load_json(self.processed_jobs_file)
+                self.duplicate_check_data = data.get('processed_jobs', {})
+                logger.info(f"Loaded {len(self.duplicate_check_data)} previously processed jobs")
             else:
                 self.duplicate_check_data = {}
                 logger.info("No previous job processing data found")
         except Exception as e:
             logger.error(f"Error loading processed jobs: {e}")
             self.duplicate_check_data = {}
+        
+        self._replay_journal()
+    
+    def _replay_journal(self):
+        """Apply records appended after the last snapshot"""
+        if not self.processed_jobs_journal.exists():
+            return
+        
+        replayed = 0
+        torn = False
+        with open(self.processed_jobs_journal, 'rb') as f:
+            for line in f:
+                try:
+                    self.duplicate_check_data.update(loads(line))
+                    replayed += 1
+                except ValueError:
+                    # A torn final line from an interrupted write; everything before it is intact
+                    logger.warning(f"Skipping unreadable line in {self.processed_jobs_journal}")
+                    torn = True
+        
+        self._journal_entries = replayed
+        if replayed:
+            logger.info(f"Replayed {replayed} job records from {self.processed_jobs_journal}")
+        
+        if torn:
+            # Checkpoint now so new records aren't appended after the partial line
+            self._save_processed_jobs()
+    
+    def _append_to_journal(self, job_id: str, job_record: Dict):
+        """Append one record to the journal and checkpoint when it grows large"""
+        try:
+            if self._journal is None:
+                self._journal = open(self.processed_jobs_journal, 'ab')
+            self._journal.write(dumps_bytes({job_id: job_record}) + b'\n')
+            self._journal.flush()
+            self._journal_entries += 1
+        except Exception as e:
+            logger.error(f"Error appending to processed jobs journal: {e}")
+            self._save_processed_jobs()
+            return
+        
+        if self._journal_entries >= PROCESSED_JOBS_CHECKPOINT_INTERVAL:
+            self._save_processed_jobs()
+    
+    @staticmethod
+    def _job_signature(job_title: str, company_name: str) -> str:
+        """Title + company key used to catch reposts"""
+        return f"{job_title.lower().strip()}_{company_name.lower().strip()}"
+    
+    def _index_job(self, job_id: str, job_data: Dict):
+        """Add a single record to the duplicate lookup indexes"""
+        job_link = job_data.get('job_link')
+        if job_link:
+            self._by_link[job_link] = job_id
+        
+        processed_epoch = self._record_epoch(job_data)
+        if processed_epoch is not None:
+            signature = self._job_signature(job_data.get('job_title', ''), job_data.get('company_name', ''))
+            if processed_epoch > self._by_sig.get(signature, float('-inf')):
+                self._by_sig[signature] = processed_epoch
+    
+    @staticmethod
+    def _record_epoch(job_data: Dict) -> Optional[float]:
+        """Processed time of a record as a Unix epoch (older records only carry the ISO string)"""
+        processed_epoch = job_data.get('processed_epoch')
+        if processed_epoch is not None:
+            return processed_epoch
+        
+        processed_date_str = job_data.get('processed_date')
+        if not processed_date_str:
+            return None
+        try:
+            return datetime.fromisoformat(processed_date_str.replace('Z', '+00:00')).timestamp()
+        except Exception:
+            return None
+    
+    def _rebuild_indexes(self):
+        """Rebuild duplicate lookup indexes from duplicate_check_data"""
+        self._by_link = {}
+        self._by_sig = {}
+        for job_id, job_data in self.duplicate_check_data.items():
+            self._index_job(job_id, job_data)
     
     def _save_processed_jobs(self):
         """Save processed jobs data"""
         try:
             data = {
-                'last_updated': datetime.now().isoformat(),
+                'last_updated': _now_iso(),
                 'processed_jobs': self.duplicate_check_data,
                 'total_processed_count': len(self.duplicate_check_data)
             }
             
-            with open(self.processed_jobs_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Machine-read state: compact, no indentation (only the session summary is pretty-printed)
+            write_json(self.processed_jobs_file, data)
+            
+            # Snapshot now holds everything, so the journal can start over
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+            if self.processed_jobs_journal.exists():
+                self.processed_jobs_journal.unlink()
+            self._journal_entries = 0
                 
         except Exception as e:
             logger.error(f"Error saving processed jobs: {e}")
@@ -103,17 +277,32 @@ class JobCounter:
                     'applicant_country': settings.APPLICANT_COUNTRY,
                     'fit_score_threshold': settings.FIT_SCORE_THRESHOLD
                 },
-                'processed_job_ids': self.session_jobs
+                'processed_job_count': self._session_job_count,
+                'processed_job_ids_file': self.session_jobs_file.name if self._session_job_count > 0 else None
             }
             
-            with open(summary_file, 'w', encoding='utf-8') as f:
-                json.dump(session_data, f, indent=2, ensure_ascii=False)
+            if self._session_jobs_log is not None:
+                self._session_jobs_log.close()
+                self._session_jobs_log = None
+            
+            # atomic write (temp file + rename) so a crash can't leave a truncated summary
+            write_json(summary_file, session_data, pretty=True)
                 
             logger.info(f"Session summary saved to: {summary_file}")
             
         except Exception as e:
             logger.error(f"Error saving session summary: {e}")
     
+    def _log_session_job(self, job_id: str):
+        """Append a job ID to this session's JSONL log (the summary only references the file)"""
+        try:
+            if self._session_jobs_log is None:
+                self._session_jobs_log = open(self.session_jobs_file, 'ab')
+            self._session_jobs_log.write(dumps_bytes(job_id) + b'\n')
+            self._session_jobs_log.flush()
+        except Exception as e:
+            logger.error(f"Error logging session job: {e}")
+    
     def increment_scraped(self, count: int = 1):
         """Increment scraped jobs counter"""
         self.stats.total_scraped += count
@@ -132,32 +321,34 @@ class JobCounter:
             return True
         
         # Check by URL (some sites reuse URLs with different IDs)
-        for existing_id, job_data in self.duplicate_check_data.items():
-            if job_data.get('job_link') == job_link:
-                return True
+        if job_link and job_link in self._by_link:
+            return True
         
         # Check by title + company combination (catch reposts)
-        job_signature = f"{job_title.lower().strip()}_{company_name.lower().strip()}"
-        for existing_id, job_data in self.duplicate_check_data.items():
-            existing_signature = f"{job_data.get('job_title', '').lower().strip()}_{job_data.get('company_name', '').lower().strip()}"
-            if job_signature == existing_signature:
-                # Additional check: only consider duplicate if posted within last 30 days
-                if self._is_recent_posting(job_data.get('processed_date')):
-                    return True
-        
-        return False
-    
-    def _is_recent_posting(self, processed_date_str: Optional[str]) -> bool:
-        """Check if a job was processed recently (within 30 days)"""
-        if not processed_date_str:
-            return False
+        # Additional check: only consider duplicate if posted within last 30 days
+        return self._is_recent_posting(self._by_sig.get(self._job_signature(job_title, company_name)))
+    
+    def batch_is_duplicate(self, job_ids: List[str], job_links: List[str],
+                           job_titles: List[str], company_names: List[str]) -> np.ndarray:
+        """Vectorized is_duplicate_job over parallel lists of candidates; returns a bool array"""
         
-        try:
-            processed_date = datetime.fromisoformat(processed_date_str.replace('Z', '+00:00'))
-            cutoff_date = datetime.now() - timedelta(days=30)
-            return processed_date > cutoff_date
-        except Exception:
-            return False
+        count = len(job_ids)
+        if not (len(job_links) == len(job_titles) == len(company_names) == count):
+            raise ValueError("batch_is_duplicate expects lists of equal length")
+        
+        by_id = np.fromiter((job_id in self.duplicate_check_data for job_id in job_ids), dtype=bool, count=count)
+        by_link = np.fromiter((bool(link) and link in self._by_link for link in job_links), dtype=bool, count=count)
+        sig_epochs = np.fromiter(
+            (self._by_sig.get(self._job_signature(title, company), -np.inf)
+             for title, company in zip(job_titles, company_names)),
+            dtype=np.float64, count=count
+        )
+        
+        return by_id | by_link | (sig_epochs > self._recent_cutoff_epoch)
+    
+    def _is_recent_posting(self, processed_epoch: Optional[float]) -> bool:
+        """Check if a job was processed recently (within 30 days of session start)"""
+        return processed_epoch is not None and processed_epoch > self._recent_cutoff_epoch
     
     def record_job_attempt(self, job_id: str, job_title: str, company_name: str, 
                           job_link: str, status: str, ignore_reason: Optional[str] = None):
@@ -170,11 +361,14 @@ class JobCounter:
             'job_link': job_link,
             'status': status,
             'ignore_reason': ignore_reason,
-            'processed_date': datetime.now().isoformat()
+            'processed_date': _now_iso(),
+            'processed_epoch': time.time()
         }
+        self._index_job(job_id, self.duplicate_check_data[job_id])
         
         # Track this session
-        self.session_jobs.append(job_id)
+        self._session_job_count += 1
+        self._log_session_job(job_id)
         
         # Update counters based on status
         if status == "ready_to_apply":
@@ -189,8 +383,8 @@ class JobCounter:
             elif ignore_reason == "duplicate":
                 self.stats.ignored_duplicate += 1
         
-        # Save after each job to prevent data loss
-        self._save_processed_jobs()
+        # Journal after each job to prevent data loss (full snapshot every few jobs)
+        self._append_to_journal(job_id, self.duplicate_check_data[job_id])
         
         logger.info(f"Recorded job attempt: {job_title} at {company_name} - Status: {status}")
     
@@ -240,15 +434,12 @@ class JobCounter:
             'success_rate_percentage': round(success_rate, 2),
             'remaining_slots': self.get_remaining_job_slots(),
             'can_process_more': self.can_process_more_jobs(),
-            'jobs_processed_this_session': len(self.session_jobs)
+            'jobs_processed_this_session': self._session_job_count
         }
     
     def get_processing_efficiency_report(self) -> Dict:
         """Generate efficiency report for optimization"""
-        total_ignored = (self.stats.ignored_role_unknown + 
-                        self.stats.ignored_work_permit + 
-                        self.stats.ignored_low_fit + 
-                        self.stats.ignored_duplicate)
+        total_ignored = self.stats.total_ignored
         
         efficiency_metrics = {
             'total_jobs_examined': self.stats.total_scraped,
@@ -289,29 +480,22 @@ class JobCounter:
     
     def cleanup_old_processed_jobs(self, days_to_keep: int = 90):
         """Clean up old processed job records to prevent file from growing too large"""
-        cutoff_date = datetime.now() - timedelta(days=days_to_keep)
+        cutoff_epoch = (datetime.now() - timedelta(days=days_to_keep)).timestamp()
         
         cleaned_data = {}
         removed_count = 0
         
         for job_id, job_data in self.duplicate_check_data.items():
-            processed_date_str = job_data.get('processed_date')
-            if processed_date_str:
-                try:
-                    processed_date = datetime.fromisoformat(processed_date_str.replace('Z', '+00:00'))
-                    if processed_date > cutoff_date:
-                        cleaned_data[job_id] = job_data
-                    else:
-                        removed_count += 1
-                except Exception:
-                    # Keep job if date parsing fails
-                    cleaned_data[job_id] = job_data
-            else:
-                # Keep job if no date
+            processed_epoch = self._record_epoch(job_data)
+            if processed_epoch is None or processed_epoch > cutoff_epoch:
+                # Keep job if it is recent, has no date, or the date can't be parsed
                 cleaned_data[job_id] = job_data
+            else:
+                removed_count += 1
         
         if removed_count > 0:
             self.duplicate_check_data = cleaned_data
+            self._rebuild_indexes()
             self._save_processed_jobs()
             logger.info(f"Cleaned up {removed_count} old job records (older than {days_to_keep} days)")
         
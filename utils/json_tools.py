@@ -0,0 +1,51 @@
+"""
+JSON serialization helpers with optional orjson acceleration
+"""
+import json
+import os
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps_bytes(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize an object to UTF-8 JSON bytes"""
+
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            # orjson is stricter than the stdlib (e.g. >64-bit ints); fall through
+            pass
+
+    return json.dumps(obj, indent=2 if pretty else None, ensure_ascii=False).encode('utf-8')
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON text or bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_json(path: Union[str, Path]) -> Any:
+    """Read and parse a JSON file"""
+    return loads(Path(path).read_bytes())
+
+
+def write_json(path: Union[str, Path], obj: Any, pretty: bool = False) -> Path:
+    """Atomically write an object as JSON (temp file + rename)"""
+
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_bytes(dumps_bytes(obj, pretty=pretty))
+    os.replace(tmp_path, path)
+    return path
@@ -5,20 +5,116 @@ import os
 import gc
 import re
 import logging
+from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import base64
+import hashlib
 from pathlib import Path
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+_HAS_DIGIT_RE = re.compile(r'\d')
+
+# Every Fernet token starts with this (base64 of the 0x80 version byte + timestamp)
+_FERNET_PREFIX = b'gAAAAA'
+
+
+def _compile_pii_alternation(patterns: Dict[str, str]):
+    """Compile PII patterns into one case-insensitive named-group alternation (RE2 when available)"""
+    combined = '|'.join(f'(?P<{pii_type}>{pattern})' for pii_type, pattern in patterns.items())
+    return (re2 if RE2_AVAILABLE else re).compile('(?i)' + combined)
+
+
+@lru_cache(maxsize=8)
+def _derive_key(password: str, salt: bytes) -> bytes:
+    """Derive a urlsafe-base64 Fernet key from a password (cached per process)"""
+    # hashlib goes straight to OpenSSL's PBKDF2 (SHA extensions where the CPU has them)
+    key = hashlib.pbkdf2_hmac('sha256', password.encode(), salt, 100000, dklen=32)
+    return base64.urlsafe_b64encode(key)
+
+
+# Both caches are keyed by the sorted placeholders only: replacement values are looked up
+# in the caller's mapping at call time, so restoring the same placeholder set reuses
+# one compiled matcher across candidates and requests. Matchers over raw PII (the
+# sanitize side) are never cached, so no plaintext outlives the call.
+
+@lru_cache(maxsize=256)
+def _placeholder_pattern(placeholders: Tuple[str, ...]) -> re.Pattern:
+    """Compile one alternation matching every given placeholder"""
+    # Longest first so a placeholder never shadows a longer one sharing its prefix
+    return re.compile('|'.join(map(re.escape, sorted(placeholders, key=len, reverse=True))))
+
+
+def _build_automaton(literals: Tuple[str, ...]):
+    """Build an Aho-Corasick automaton over the given literals"""
+    automaton = ahocorasick.Automaton()
+    for literal in literals:
+        automaton.add_word(literal, literal)
+    automaton.make_automaton()
+    return automaton
+
+
+@lru_cache(maxsize=256)
+def _placeholder_automaton(placeholders: Tuple[str, ...]):
+    """Cached automaton over placeholders (never over raw PII)"""
+    return _build_automaton(placeholders)
+
+
+def _replace_literals(text: str, replacements: Dict[str, str], cache_automaton: bool = False) -> str:
+    """
+    Replace every literal key in text with its value in a single left-to-right scan.
+    Only pass cache_automaton=True when the keys are placeholders, not PII.
+    """
+    replacements = {literal: replacement for literal, replacement in replacements.items() if literal}
+    if not replacements:
+        return text
+    
+    if not AHOCORASICK_AVAILABLE:
+        for literal, replacement in replacements.items():
+            text = text.replace(literal, replacement)
+        return text
+    
+    literals = tuple(sorted(replacements))
+    automaton = _placeholder_automaton(literals) if cache_automaton else _build_automaton(literals)
+    
+    # iter_long yields leftmost-longest, non-overlapping matches in text order
+    pieces = []
+    pos = 0
+    for end, literal in automaton.iter_long(text):
+        pieces.append(text[pos:end - len(literal) + 1])
+        pieces.append(replacements[literal])
+        pos = end + 1
+    pieces.append(text[pos:])
+    return ''.join(pieces)
+
+
+class _PlaceholderMap(dict):
+    """Placeholder lookup that builds and remembers '[TYPE]' for unknown PII types"""
+    
+    def __missing__(self, pii_type: str) -> str:
+        placeholder = self[pii_type] = f'[{pii_type.upper()}]'
+        return placeholder
+
+
 class PIIProtector:
     """Handles encryption, placeholders, and secure memory management for PII"""
     
-    # Standard placeholders for AI processing
-    PLACEHOLDERS = {
+    # Standard placeholders for AI processing (unknown types get '[TYPE]' on first lookup)
+    PLACEHOLDERS = _PlaceholderMap({
         'name': '[CANDIDATE_NAME]',
         'email': '[CANDIDATE_EMAIL]',
         'phone': '[CANDIDATE_PHONE]',
@@ -26,8 +122,23 @@ class PIIProtector:
         'city': '[CANDIDATE_CITY]',
         'country': '[CANDIDATE_COUNTRY]',
         'postal_code': '[POSTAL_CODE]'
+    })
+    
+    _SALT = b'job_agent_salt_2024'  # In production, use random salt per user
+    
+    # Auto-detection patterns (inner groups must stay non-capturing)
+    PII_PATTERNS = {
+        'email': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
+        'phone': r'(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
+        'postal_code': r'\b\d{5}(?:-\d{4})?\b|\b[A-Z]\d[A-Z]\s?\d[A-Z]\d\b',
     }
     
+    # All patterns as one named alternation, so the text is scanned once.
+    # RE2 matches it as a DFA in linear time; the stdlib engine is the fallback.
+    _COMBINED_PATTERN = _compile_pii_alternation(PII_PATTERNS)
+    # Phone and postal code only, for text without an '@'
+    _NUMERIC_PATTERN = _compile_pii_alternation({k: v for k, v in PII_PATTERNS.items() if k != 'email'})
+    
     def __init__(self, master_password: Optional[str] = None):
         """Initialize PII protector with optional encryption"""
         self.master_password = master_password or os.getenv("PII_MASTER_PASSWORD", "")
@@ -39,16 +150,7 @@ class PIIProtector:
     
     def _create_cipher(self, password: str) -> Fernet:
         """Create encryption cipher from password"""
-        password_bytes = password.encode()
-        salt = b'job_agent_salt_2024'  # In production, use random salt per user
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
-        )
-        key = base64.urlsafe_b64encode(kdf.derive(password_bytes))
-        return Fernet(key)
+        return Fernet(_derive_key(password, self._SALT))
     
     def encrypt_data(self, data: str) -> str:
         """Encrypt sensitive data for storage"""
@@ -57,8 +159,8 @@ class PIIProtector:
             return data
         
         try:
-            encrypted = self._cipher.encrypt(data.encode())
-            return base64.urlsafe_b64encode(encrypted).decode()
+            # Fernet tokens are already urlsafe base64 ASCII
+            return self._cipher.encrypt(data.encode()).decode('ascii')
         except Exception as e:
             logger.error(f"Encryption failed: {e}")
             return data
@@ -69,72 +171,141 @@ class PIIProtector:
             return encrypted_data
         
         try:
-            encrypted_bytes = base64.urlsafe_b64decode(encrypted_data.encode())
-            decrypted = self._cipher.decrypt(encrypted_bytes)
-            return decrypted.decode()
+            return self._decrypt_token(encrypted_data)
         except Exception as e:
             logger.error(f"Decryption failed: {e}")
             return encrypted_data
     
+    def _decrypt_token(self, token: str) -> str:
+        """Decrypt a Fernet token, accepting the legacy double-base64 form too"""
+        token_bytes = token.encode('ascii')
+        if not token_bytes.startswith(_FERNET_PREFIX):
+            # Written by older versions that base64-wrapped the Fernet token again
+            token_bytes = base64.urlsafe_b64decode(token_bytes)
+        return self._cipher.decrypt(token_bytes).decode()
+    
+    def encrypt_batch(self, items: List[str]) -> List[str]:
+        """Encrypt several values with one cipher, returning raw Fernet tokens"""
+        if not self._cipher:
+            logger.warning("No encryption key provided, storing data in plain text")
+            return list(items)
+        
+        encrypted_items = []
+        for data in items:
+            try:
+                # Fernet tokens are already urlsafe base64, so no second encoding pass
+                encrypted_items.append(self._cipher.encrypt(data.encode()).decode('ascii'))
+            except Exception as e:
+                logger.error(f"Encryption failed: {e}")
+                encrypted_items.append(data)
+        return encrypted_items
+    
+    def decrypt_batch(self, items: List[str]) -> List[str]:
+        """Decrypt several Fernet tokens with one cipher"""
+        if not self._cipher:
+            return list(items)
+        
+        decrypted_items = []
+        for token in items:
+            try:
+                decrypted_items.append(self._decrypt_token(token))
+            except Exception as e:
+                logger.error(f"Decryption failed: {e}")
+                decrypted_items.append(token)
+        return decrypted_items
+    
+    def _iter_pii_matches(self, text: str):
+        """Yield auto-detected PII regex matches in text order"""
+        # Emails need an '@' and phone/postal codes need a digit; both checks run in C
+        if '@' in text:
+            return self._COMBINED_PATTERN.finditer(text)
+        if _HAS_DIGIT_RE.search(text):
+            return self._NUMERIC_PATTERN.finditer(text)
+        return iter(())
+    
     def extract_pii_from_text(self, text: str) -> Dict[str, List[str]]:
         """Extract potential PII patterns from text"""
-        pii_patterns = {
-            'email': r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-            'phone': r'(\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
-            'postal_code': r'\b\d{5}(-\d{4})?\b|\b[A-Z]\d[A-Z]\s?\d[A-Z]\d\b',
-        }
-        
         found_pii = {}
-        for pii_type, pattern in pii_patterns.items():
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                found_pii[pii_type] = matches
+        for match in self._iter_pii_matches(text):
+            found_pii.setdefault(match.lastgroup, []).append(match.group())
         
         return found_pii
     
-    def sanitize_for_ai(self, text: str, pii_data: Dict[str, str]) -> Tuple[str, Dict[str, str]]:
+    def sanitize_for_ai(self, text: str, pii_data: Dict[str, str],
+                        auto_detect: bool = True) -> Tuple[str, Dict[str, str]]:
         """
         Replace PII with placeholders for AI processing
+        Set auto_detect=False when pii_data already covers every value to hide
         Returns: (sanitized_text, replacement_mapping)
         """
-        sanitized_text = text
         replacement_mapping = {}
+        known_literals = {}
         
         # Replace known PII with placeholders
         for pii_type, value in pii_data.items():
             if value and value.strip():
-                placeholder = self.PLACEHOLDERS.get(pii_type, f'[{pii_type.upper()}]')
+                placeholder = self.PLACEHOLDERS[pii_type]
                 
                 # Handle multi-line addresses
                 if pii_type == 'address' and '\n' in value:
                     lines = value.split('\n')
-                    for i, line in enumerate(lines):
-                        if line.strip():
+                    stripped_lines = [line.strip() for line in lines]
+                    block_lines = []
+                    # Swap the whole block in one splice when it appears verbatim, so short
+                    # lines (e.g. a ZIP) are not also replaced elsewhere in the text
+                    block_in_text = value in text
+                    for i, (line, stripped) in enumerate(zip(lines, stripped_lines)):
+                        if stripped:
                             line_placeholder = f'[ADDRESS_LINE_{i+1}]'
-                            sanitized_text = sanitized_text.replace(line.strip(), line_placeholder)
-                            replacement_mapping[line_placeholder] = line.strip()
+                            block_lines.append(line.replace(stripped, line_placeholder, 1))
+                            if not block_in_text:
+                                known_literals.setdefault(stripped, line_placeholder)
+                            replacement_mapping[line_placeholder] = stripped
+                        else:
+                            block_lines.append(line)
+                    if block_in_text:
+                        known_literals.setdefault(value, '\n'.join(block_lines))
                 else:
-                    sanitized_text = sanitized_text.replace(value, placeholder)
+                    known_literals.setdefault(value, placeholder)
                     replacement_mapping[placeholder] = value
         
-        # Auto-detect and replace additional PII
-        detected_pii = self.extract_pii_from_text(sanitized_text)
-        for pii_type, matches in detected_pii.items():
-            placeholder = self.PLACEHOLDERS.get(pii_type, f'[{pii_type.upper()}]')
-            for match in matches:
-                if isinstance(match, tuple):
-                    match = match[0]  # Handle regex groups
-                sanitized_text = sanitized_text.replace(match, placeholder)
-                replacement_mapping[placeholder] = match
+        sanitized_text = _replace_literals(text, known_literals)
+        if not auto_detect:
+            return sanitized_text, replacement_mapping
+        
+        # Auto-detect and replace additional PII, splicing the match spans in one pass
+        pieces = []
+        pos = 0
+        for match in self._iter_pii_matches(sanitized_text):
+            pii_type = match.lastgroup
+            placeholder = self.PLACEHOLDERS[pii_type]
+            pieces.append(sanitized_text[pos:match.start()])
+            pieces.append(placeholder)
+            pos = match.end()
+            replacement_mapping[placeholder] = match.group()
+        
+        if pieces:
+            pieces.append(sanitized_text[pos:])
+            sanitized_text = ''.join(pieces)
         
         return sanitized_text, replacement_mapping
     
     def restore_pii(self, text: str, replacement_mapping: Dict[str, str]) -> str:
         """Restore original PII from placeholders"""
-        restored_text = text
-        for placeholder, original_value in replacement_mapping.items():
-            restored_text = restored_text.replace(placeholder, original_value)
-        return restored_text
+        if not any(replacement_mapping):
+            return text
+        
+        if AHOCORASICK_AVAILABLE:
+            return _replace_literals(text, replacement_mapping, cache_automaton=True)
+        
+        pattern = _placeholder_pattern(tuple(sorted(filter(None, replacement_mapping))))
+        return pattern.sub(lambda match: replacement_mapping[match.group()], text)
+    
+    @staticmethod
+    def clear_pattern_cache():
+        """Drop the cached restore/replace patterns (e.g. between tests)"""
+        _placeholder_pattern.cache_clear()
+        _placeholder_automaton.cache_clear()
     
     def secure_clear_variable(self, var_name: str, local_vars: dict = None, global_vars: dict = None):
         """Securely clear sensitive variables from memory"""
@@ -147,19 +318,17 @@ class PIIProtector:
         # Clear from global scope if provided
         if global_vars and var_name in global_vars:
             del global_vars[var_name]
-        
-        # Force garbage collection
-        gc.collect()
     
-    def clear_all_sensitive_vars(self):
-        """Clear all tracked sensitive variables"""
-        gc.collect()
+    def clear_all_sensitive_vars(self, force_gc: bool = False):
+        """Clear all tracked sensitive variables (full GC sweep only when forced)"""
+        if force_gc:
+            gc.collect()
         self._sensitive_vars.clear()
     
     def create_audit_log(self, operation: str, data_types: List[str], ai_service: str = "openai"):
         """Log PII handling operations for audit trail"""
         audit_entry = {
-            'timestamp': __import__('datetime').datetime.now().isoformat(),
+            'timestamp': datetime.now().isoformat(),
             'operation': operation,
             'data_types': data_types,
             'ai_service': ai_service,
@@ -177,6 +346,7 @@ class SecureConfigLoader:
     def __init__(self, pii_protector: PIIProtector):
         self.pii_protector = pii_protector
         self._loaded_config = {}
+        self._cached_sanitized: Optional[Tuple[Dict[str, str], Dict[str, str]]] = None
     
     def load_candidate_info(self) -> Dict[str, str]:
         """Load candidate information with optional decryption"""
@@ -189,31 +359,44 @@ class SecureConfigLoader:
             'country': settings.APPLICANT_COUNTRY
         }
         
-        # Decrypt if encrypted
-        for key, value in candidate_info.items():
-            if value and value.startswith('gAAAAA'):  # Fernet encrypted data starts with this
-                candidate_info[key] = self.pii_protector.decrypt_data(value)
+        # Decrypt if encrypted: one prefix test per field, then a single batch call
+        fernet_prefix = _FERNET_PREFIX.decode('ascii')
+        encrypted_keys = [
+            key for key, value in candidate_info.items()
+            if value and value.startswith(fernet_prefix)
+        ]
+        if encrypted_keys:
+            decrypted = self.pii_protector.decrypt_batch([candidate_info[key] for key in encrypted_keys])
+            candidate_info.update(zip(encrypted_keys, decrypted))
         
         self._loaded_config.update(candidate_info)
         return candidate_info
     
     def parse_contact_info(self, email_phone_string: str) -> Dict[str, str]:
         """Parse email and phone from combined string"""
-        lines = email_phone_string.strip().split('\n')
         email = ""
         phone = ""
         
-        for line in lines:
+        for line in email_phone_string.splitlines():
             line = line.strip()
             if '@' in line:
                 email = line
-            elif any(char.isdigit() for char in line):
+            elif _HAS_DIGIT_RE.search(line):
                 phone = line
         
         return {'email': email, 'phone': phone}
     
     def get_sanitized_candidate_info(self) -> Tuple[Dict[str, str], Dict[str, str]]:
-        """Get candidate info with PII placeholders for AI processing"""
+        """Get candidate info with PII placeholders for AI processing (computed once until cleared)"""
+        if self._cached_sanitized is None:
+            self._cached_sanitized = self._build_sanitized_candidate_info()
+        
+        # Hand out copies so callers cannot mutate the cached mapping
+        sanitized_info, replacement_mappings = self._cached_sanitized
+        return dict(sanitized_info), dict(replacement_mappings)
+    
+    def _build_sanitized_candidate_info(self) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """Load candidate info and derive its placeholders and replacement mapping"""
         candidate_info = self.load_candidate_info()
         
         # Parse contact info
@@ -234,7 +417,7 @@ class SecureConfigLoader:
         
         for key, value in all_pii.items():
             if value:
-                placeholder = self.pii_protector.PLACEHOLDERS.get(key, f'[{key.upper()}]')
+                placeholder = self.pii_protector.PLACEHOLDERS[key]
                 sanitized_info[key] = placeholder
                 replacement_mappings[placeholder] = value
         
@@ -242,9 +425,10 @@ class SecureConfigLoader:
     
     def clear_loaded_config(self):
         """Securely clear loaded configuration"""
-        for key in list(self._loaded_config.keys()):
-            self.pii_protector.secure_clear_variable(key, self._loaded_config)
+        # Track the keys for auditing, then drop every value in one go
+        self.pii_protector._sensitive_vars.update(self._loaded_config)
         self._loaded_config.clear()
+        self._cached_sanitized = None
 
 
 # Global instance for easy access
@@ -266,17 +450,17 @@ def secure_ai_processing(func):
             result = func(*args, **kwargs)
             return result
         finally:
-            # Clear sensitive data after processing
+            # Clear sensitive data after processing; refcounting frees it without a GC sweep
             pii_protector.clear_all_sensitive_vars()
-            gc.collect()
     
     return wrapper
 
 
 # Utility functions for quick access
-def sanitize_text_for_ai(text: str, candidate_info: Dict[str, str]) -> Tuple[str, Dict[str, str]]:
+def sanitize_text_for_ai(text: str, candidate_info: Dict[str, str],
+                         auto_detect: bool = True) -> Tuple[str, Dict[str, str]]:
     """Quick function to sanitize text for AI processing"""
-    return pii_protector.sanitize_for_ai(text, candidate_info)
+    return pii_protector.sanitize_for_ai(text, candidate_info, auto_detect=auto_detect)
 
 def restore_text_from_ai(text: str, replacement_mapping: Dict[str, str]) -> str:
     """Quick function to restore PII in AI output"""
@@ -1,9 +1,11 @@
 """
 Job scraping utilities for extracting job postings from various sources
 """
+import asyncio
 import csv
-import json
+import itertools
 import logging
+import random
 import re
 import time
 from typing import Dict, List, Optional, Any, Tuple
@@ -11,14 +13,40 @@ from pathlib import Path
 from urllib.parse import urlparse, urljoin
 import hashlib
 import sys
+from dataclasses import dataclass
+from functools import lru_cache
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     from bs4 import BeautifulSoup
+    import soupsieve
     SCRAPING_AVAILABLE = True
 except ImportError:
     SCRAPING_AVAILABLE = False
 
+try:
+    # BeautifulSoup tree builder, and direct XPath extraction when selectolax is missing
+    from lxml import etree, html as lxml_html
+    HTML_PARSER = 'lxml'
+    LXML_AVAILABLE = True
+except ImportError:
+    HTML_PARSER = 'html.parser'
+    LXML_AVAILABLE = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
 try:
     from selenium import webdriver
     from selenium.webdriver.common.by import By
@@ -31,9 +59,249 @@ except ImportError:
     SELENIUM_AVAILABLE = False
 
 from config import settings
+from utils.filters import _TermMatcher
+from utils.json_tools import load_json, loads, write_json
 
 logger = logging.getLogger(__name__)
 
+# __slots__ dataclasses need Python 3.10+; older interpreters get regular ones
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Headers shared by every request; set once on the session
+SESSION_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept-Language': 'en-GB,en;q=0.9'
+}
+
+# Fixed endpoints plus the headers each remote job board needs on top of the session's
+REMOTEOK_API_URL = "https://remoteok.com/api/?location=Worldwide"
+REMOTEOK_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36',
+    'Accept': 'application/json, text/html'
+}
+WWR_URL = "https://weworkremotely.com/100-percent-remote-jobs"
+WWR_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/137.0.0.0',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Referer': 'https://www.google.com/'
+}
+
+# Class-attribute patterns for BeautifulSoup lookups, compiled once per process
+_RE_LISTING = re.compile(r'listing|job|feature|new-listing')
+_RE_GENERIC_JOB = re.compile(r'job|listing|card')
+_RE_TITLE = re.compile(r'title|job-title')
+_RE_COMPANY = re.compile(r'company')
+_RE_COMPANY_OR_EMPLOYER = re.compile(r'company|employer')
+_RE_LOCATION = re.compile(r'location')
+_RE_LOCATION_OR_ADDRESS = re.compile(r'location|address')
+_RE_WHITESPACE = re.compile(r'\s+')
+# A lone substring attribute selector such as [class*="company"]
+_RE_ATTR_CONTAINS = re.compile(r'^\[([\w-]+)\*="([^"]+)"\]$')
+# A lone class (.job-title) or tag (h1) selector
+_RE_CSS_CLASS = re.compile(r'^\.[\w-]+$')
+_RE_CSS_TAG = re.compile(r'^[a-z][a-z0-9]*$')
+
+# CSS equivalents of the listing class regexes (substring match on the class attribute)
+WWR_LISTING_CSS = 'li[class*="listing"], li[class*="job"], li[class*="feature"]'
+GENERIC_LISTING_CSS = ', '.join(
+    f'{tag}[class*="{word}"]' for tag in ('div', 'article', 'li') for word in ('job', 'listing', 'card')
+)
+
+# Substring -> country for scraped location strings; earlier entries win when several match
+COUNTRY_MAPPING = {
+    'usa': 'United States',
+    'us': 'United States',
+    'united states': 'United States',
+    'uk': 'United Kingdom',
+    'united kingdom': 'United Kingdom',
+    'canada': 'Canada',
+    'australia': 'Australia',
+    'germany': 'Germany',
+    'france': 'France',
+    'netherlands': 'Netherlands',
+    'singapore': 'Singapore',
+    'remote': 'Remote'
+}
+
+# All keys matched in one pass over the location; values carry the table priority
+_COUNTRY_MATCHER = _TermMatcher({
+    key: (priority, country) for priority, (key, country) in enumerate(COUNTRY_MAPPING.items())
+})
+
+# Single job page selectors, tried in order for each field
+TITLE_CSS = ('h1', '.job-title', '.jobTitle', '[class*="title"]', 'title')
+COMPANY_CSS = ('.company-name', '.companyName', '[class*="company"]', '[data-testid*="company"]')
+LOCATION_CSS = ('.location', '.job-location', '[class*="location"]', '[data-testid*="location"]')
+
+# Job-page containers tried in order when extracting a full description
+DESCRIPTION_CSS = (
+    '.job-description',
+    '.jobDescription',
+    '[class*="description"]',
+    '.content',
+    'main',
+    '.job-details'
+)
+
+# Raw characters read from a description container before whitespace is collapsed
+# (only the first 5000 collapsed characters are kept)
+DESCRIPTION_TEXT_LIMIT = 20000
+
+# requests.Session connection pool: hosts kept and connections per host
+SESSION_POOL_CONNECTIONS = 32
+SESSION_POOL_MAXSIZE = 64
+
+# Persistent cache of single-URL scrape results and how long an entry stays fresh
+URL_CACHE_PATH = Path(__file__).resolve().parent.parent / "data" / "scrape_cache.json"
+URL_CACHE_TTL_SECONDS = 24 * 60 * 60
+URL_CACHE_MAX_ENTRIES = 2048
+
+# Polite pause (seconds) between sources in the sequential path
+SOURCE_DELAY_RANGE = (0.3, 1.0)
+
+# Concurrent source fetching: connections per host and keep-alive (seconds)
+SCRAPE_CONNECTIONS_PER_HOST = 8
+SCRAPE_KEEPALIVE_TIMEOUT = 30
+# WWR job detail pages all hit one host; keep at most this many in flight
+WWR_DETAIL_CONCURRENCY = 4
+
+
+@dataclass(**_SLOTS)
+class JobRecord:
+    """A scraped job listing (plain dicts are built only when results leave the scraper)"""
+    job_id: str
+    job_title: str
+    company_name: str
+    company_address: str
+    job_link: str
+    location: str
+    country: str
+    employment_type: str
+    posted_date: str
+    job_description: str
+    salary_range: str
+
+def _job_to_dict(job: JobRecord) -> Dict[str, Any]:
+    """Plain dict view of a JobRecord (cheaper than dataclasses.asdict)"""
+    return {
+        'job_id': job.job_id,
+        'job_title': job.job_title,
+        'company_name': job.company_name,
+        'company_address': job.company_address,
+        'job_link': job.job_link,
+        'location': job.location,
+        'country': job.country,
+        'employment_type': job.employment_type,
+        'posted_date': job.posted_date,
+        'job_description': job.job_description,
+        'salary_range': job.salary_range
+    }
+
+@lru_cache(maxsize=8192)
+def _job_id(title: str, company: str, source: str) -> str:
+    """Short non-cryptographic fingerprint of the combination (4 bytes = 8 hex chars)"""
+    content = f"{title}_{company}_{source}".lower()
+    return f"{source}_{hashlib.blake2b(content.encode(), digest_size=4).hexdigest()}"
+
+def _is_valid_job(job: JobRecord) -> bool:
+    """A job needs an ID plus a title and company longer than two characters"""
+    return len(job.job_title or '') > 2 and len(job.company_name or '') > 2 and bool(job.job_id)
+
+def _clean_job(job: JobRecord) -> JobRecord:
+    """Strip surrounding whitespace from the free-text fields (in place)"""
+    job.job_title = job.job_title.strip()
+    job.company_name = job.company_name.strip()
+    job.location = job.location.strip()
+    return job
+
+
+def _css_unique(node, selector: str) -> list:
+    """Selector-group matches in document order, each node once (lexbor repeats per selector)"""
+    seen = set()
+    matches = []
+    for match in node.css(selector):
+        if match.mem_id not in seen:
+            seen.add(match.mem_id)
+            matches.append(match)
+    return matches
+
+
+def _css_first_descendant(node, selector: str):
+    """First match of selector strictly below node (lexbor's css() also tests the node itself)"""
+    for match in node.css(selector):
+        if match.mem_id != node.mem_id:
+            return match
+    return None
+
+
+@lru_cache(maxsize=64)
+def _soup_select_one(selector: str):
+    """
+    First-match function for a selector on the BeautifulSoup path, built once per selector.
+    [attr*="word"] selectors use find() with a regex, which skips soupsieve's per-element
+    overhead; everything else is a precompiled soupsieve pattern.
+    """
+    match = _RE_ATTR_CONTAINS.match(selector)
+    if match is None:
+        return soupsieve.compile(selector).select_one
+    
+    attrs = {match.group(1): re.compile(re.escape(match.group(2)))}
+    
+    def find_first(tree):
+        return tree.find(attrs=attrs)
+    return find_first
+
+@lru_cache(maxsize=64)
+def _lxml_xpath(selector: str):
+    """Compiled XPath returning the first match of a job-page selector (tag, .class or [attr*="word"])"""
+    match = _RE_ATTR_CONTAINS.match(selector)
+    if match:
+        expr = f'//*[contains(@{match.group(1)}, "{match.group(2)}")]'
+    elif _RE_CSS_CLASS.match(selector):
+        expr = f'//*[contains(concat(" ", normalize-space(@class), " "), " {selector[1:]} ")]'
+    elif _RE_CSS_TAG.match(selector):
+        expr = f'//{selector}'
+    else:
+        raise ValueError(f"Selector not supported on the lxml path: {selector}")
+    return etree.XPath(f'({expr})[1]')
+
+def _first_text(tree, selector: str, limit: Optional[int] = None) -> Optional[str]:
+    """
+    Text of the first selector match in a selectolax, lxml or BeautifulSoup tree, or None.
+    With a limit, text nodes are only collected until that many characters are gathered.
+    """
+    if SELECTOLAX_AVAILABLE and isinstance(tree, HTMLParser):
+        node = tree.css_first(selector)
+        if node is None:
+            return None
+        if limit is None:
+            return node.text()
+        chunks = (child.text_content for child in node.traverse(include_text=True) if child.tag == '-text')
+    elif LXML_AVAILABLE and isinstance(tree, lxml_html.HtmlElement):
+        found = _lxml_xpath(selector)(tree)
+        if not found:
+            return None
+        if limit is None:
+            return found[0].text_content()
+        chunks = found[0].itertext()
+    else:
+        element = _soup_select_one(selector)(tree)
+        if not element:
+            return None
+        if limit is None:
+            return element.get_text()
+        chunks = element.strings
+    
+    parts = []
+    collected = 0
+    for chunk in chunks:
+        parts.append(chunk)
+        collected += len(chunk)
+        if collected >= limit:
+            break
+    return ''.join(parts)[:limit]
+
+
 class JobScraper:
     """Scrapes job postings from various job sites"""
     
@@ -45,13 +313,29 @@ class JobScraper:
         self.max_scrape_limit = settings.MAX_SCRAPE_LIMIT
         # multiplier determines how many candidates to inspect per source (default 3)
         self.per_source_multiplier = getattr(settings, "SCRAPE_SOURCE_MULTIPLIER", 3)
+        # cap on in-flight requests when fetching concurrently (default 16)
+        self.scrape_concurrency = getattr(settings, "SCRAPE_CONCURRENCY", 16)
+        self._sem: Optional[asyncio.BoundedSemaphore] = None
+        # visit each We Work Remotely job page for the full description (needs aiohttp)
+        self.fetch_wwr_descriptions = getattr(settings, "SCRAPE_WWR_DESCRIPTIONS", True)
+        self.wwr_detail_concurrency = getattr(settings, "SCRAPE_WWR_DETAIL_CONCURRENCY", WWR_DETAIL_CONCURRENCY)
         self.scraped_count = 0
+        # url -> {'cached_at': epoch seconds, 'job': job dict}; loaded on first use
+        self._url_cache: Optional[Dict[str, Dict[str, Any]]] = None
         
         # Setup session with headers to avoid blocking
         self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        self.session.headers.update(SESSION_HEADERS)
+        
+        # Larger keep-alive pool plus automatic backoff on throttling/server errors
+        adapter = HTTPAdapter(
+            pool_connections=SESSION_POOL_CONNECTIONS,
+            pool_maxsize=SESSION_POOL_MAXSIZE,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                              allowed_methods={'GET'}, respect_retry_after_header=True)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         
         logger.info("Job scraper initialized")
     
@@ -72,16 +356,20 @@ class JobScraper:
             if job_sources:
                 logger.info(f"Found {len(job_sources)} custom job sources")
                 
-                for source in job_sources:
-                    if self.scraped_count >= self.max_scrape_limit:
-                        logger.info(f"Reached scraping limit of {self.max_scrape_limit}")
-                        break
-                    
-                    site_jobs = self._scrape_from_source(source)
-                    all_jobs.extend(site_jobs)
-                    
-                    # Small delay between sources
-                    time.sleep(2)
+                if AIOHTTP_AVAILABLE and len(job_sources) > 1:
+                    # Fetch every source concurrently so network latency overlaps
+                    all_jobs.extend(asyncio.run(self._scrape_sources_async(job_sources)))
+                else:
+                    for source in job_sources:
+                        if self.scraped_count >= self.max_scrape_limit:
+                            logger.info(f"Reached scraping limit of {self.max_scrape_limit}")
+                            break
+                        
+                        site_jobs = self._scrape_from_source(source)
+                        all_jobs.extend(site_jobs)
+                        
+                        # Small jittered delay between sources (throttling is retried by the adapter)
+                        time.sleep(random.uniform(*SOURCE_DELAY_RANGE))
             
             else:
                 # No custom sources: interactive selection if TTY, otherwise default to multi fallback
@@ -107,7 +395,7 @@ class JobScraper:
             
             logger.info(f"Successfully scraped {len(validated_jobs)} unique jobs")
             
-            return validated_jobs
+            return [_job_to_dict(job) for job in validated_jobs]
             
         except Exception as e:
             logger.error(f"Error in job scraping: {e}")
@@ -124,14 +412,24 @@ class JobScraper:
             sources = []
             
             with open(self.job_sources_file, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
+                # Positional access skips building a dict per row
+                reader = csv.reader(f)
+                header = next(reader, [])
+                idx = {name: i for i, name in enumerate(header)}
+                site_idx = idx.get('site_name')
+                url_idx = idx.get('base_url')
+                params_idx = idx.get('search_params')
                 
-                for row in reader:
-                    if row.get('site_name') and row.get('base_url'):
+                if site_idx is not None and url_idx is not None:
+                    min_len = max(site_idx, url_idx) + 1
+                    for row in reader:
+                        if len(row) < min_len or not row[site_idx] or not row[url_idx]:
+                            continue
+                        search_params = row[params_idx] if params_idx is not None and params_idx < len(row) else ''
                         sources.append({
-                            'site_name': row['site_name'].strip(),
-                            'base_url': row['base_url'].strip(),
-                            'search_params': row.get('search_params', '').strip()
+                            'site_name': row[site_idx].strip(),
+                            'base_url': row[url_idx].strip(),
+                            'search_params': search_params.strip()
                         })
             
             logger.info(f"Loaded {len(sources)} job sources from CSV")
@@ -141,7 +439,19 @@ class JobScraper:
             logger.error(f"Error loading job sources: {e}")
             return []
     
-    def _scrape_from_source(self, source: Dict[str, str]) -> List[Dict[str, Any]]:
+    def _source_kind(self, site_name: str) -> str:
+        """Pick the scraping strategy for a source: indeed, remoteok, weworkremotely or generic"""
+        
+        site = site_name.lower()
+        if 'indeed' in site:
+            return 'indeed'
+        if 'remoteok' in site or 'remote ok' in site:
+            return 'remoteok'
+        if 'weworkremotely' in site or 'we work remotely' in site or 'wework' in site:
+            return 'weworkremotely'
+        return 'generic'
+    
+    def _scrape_from_source(self, source: Dict[str, str]) -> List[JobRecord]:
         """Scrape jobs from a specific source"""
         
         site_name = source['site_name']
@@ -151,26 +461,100 @@ class JobScraper:
         
         try:
             # Different scraping strategies based on site
-            if 'indeed' in site_name.lower():
-                 return self._scrape_indeed_jobs(base_url, source.get('search_params', ''))
-            elif 'remoteok' in site_name.lower() or 'remote ok' in site_name.lower():
+            kind = self._source_kind(site_name)
+            if kind == 'indeed':
+                return self._scrape_indeed_jobs(base_url, source.get('search_params', ''))
+            elif kind == 'remoteok':
                 return self._scrape_remoteok_jobs(base_url)
-            elif 'weworkremotely' in site_name.lower() or 'we work remotely' in site_name.lower() or 'wework' in site_name.lower():
+            elif kind == 'weworkremotely':
                 return self._scrape_weworkremotely_jobs(base_url)
             else:
-                 # Generic scraping approach
-                 return self._scrape_generic_jobs(base_url, source.get('search_params', ''))
-                 
+                # Generic scraping approach
+                return self._scrape_generic_jobs(base_url, source.get('search_params', ''))
+        
         except Exception as e:
-             logger.error(f"Error scraping from {site_name}: {e}")
-             return []
+            logger.error(f"Error scraping from {site_name}: {e}")
+            return []
+    
+    def _source_request(self, source: Dict[str, str]) -> Tuple[str, Optional[Dict[str, str]], Optional[Dict[str, str]], int]:
+        """Return (url, params, headers, timeout) for fetching a source's listing page"""
+        
+        kind = self._source_kind(source['site_name'])
+        if kind == 'remoteok':
+            return REMOTEOK_API_URL, None, REMOTEOK_HEADERS, 15
+        if kind == 'weworkremotely':
+            return WWR_URL, None, WWR_HEADERS, 15
+        return source['base_url'], self._parse_search_params(source.get('search_params', '')), None, 10
+    
+    def _parse_source_content(self, source: Dict[str, str], content: bytes) -> List[JobRecord]:
+        """Extract jobs from an already fetched listing response"""
+        
+        kind = self._source_kind(source['site_name'])
+        if kind == 'indeed':
+            return self._parse_indeed_jobs(content, source['base_url'])
+        if kind == 'remoteok':
+            return self._parse_remoteok_jobs(loads(content))
+        if kind == 'weworkremotely':
+            return self._parse_weworkremotely_jobs(content)
+        return self._parse_generic_jobs(content, source['base_url'])
+    
+    async def _scrape_from_source_async(self, source: Dict[str, str], session: 'aiohttp.ClientSession') -> bytes:
+        """Fetch a source's listing page on the shared aiohttp session"""
+        
+        logger.info(f"Scraping jobs from {source['site_name']}...")
+        
+        url, params, headers, timeout = self._source_request(source)
+        async with self._sem:
+            async with session.get(url, params=params, headers=headers,
+                                   timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                response.raise_for_status()
+                return await response.read()
+    
+    async def _scrape_sources_async(self, job_sources: List[Dict[str, str]]) -> List[JobRecord]:
+        """Fetch all sources concurrently, then parse them in CSV order"""
+        
+        # Created per run so it belongs to the event loop asyncio.run just started
+        self._sem = asyncio.BoundedSemaphore(self.scrape_concurrency)
+        async with self._open_async_session() as session:
+            tasks = [asyncio.ensure_future(self._scrape_from_source_async(source, session)) for source in job_sources]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            
+            # Parsing stays sequential so the scrape limit is applied in source order
+            jobs = []
+            wwr_jobs = []
+            for source, result in zip(job_sources, results):
+                if self.scraped_count >= self.max_scrape_limit:
+                    logger.info(f"Reached scraping limit of {self.max_scrape_limit}")
+                    break
+                
+                try:
+                    if isinstance(result, Exception):
+                        raise result
+                    site_jobs = self._parse_source_content(source, result)
+                    jobs.extend(site_jobs)
+                    if self._source_kind(source['site_name']) == 'weworkremotely':
+                        wwr_jobs.extend(site_jobs)
+                except Exception as e:
+                    logger.error(f"Error scraping from {source['site_name']}: {e}")
+            
+            if wwr_jobs and self.fetch_wwr_descriptions:
+                await self._fetch_weworkremotely_descriptions(wwr_jobs, session)
+        
+        return jobs
     
-    def _scrape_remote_jobs_fallback(self, mode: str = "multi") -> List[Dict[str, Any]]:
+    def _open_async_session(self) -> 'aiohttp.ClientSession':
+        """Create the pooled aiohttp session used for concurrent fetching"""
+        
+        connector = aiohttp.TCPConnector(limit_per_host=SCRAPE_CONNECTIONS_PER_HOST,
+                                         keepalive_timeout=SCRAPE_KEEPALIVE_TIMEOUT)
+        return aiohttp.ClientSession(connector=connector, headers=SESSION_HEADERS)
+    
+    def _scrape_remote_jobs_fallback(self, mode: str = "multi") -> List[JobRecord]:
         """Fallback: prefer RemoteOK (API) then WeWorkRemotely (scrape) to reach max_scrape_limit.
         mode: "multi" | "remoteok" | "weworkremotely"
         """
         logger.info("Using remote jobs fallback (mode=%s)", mode)
-        jobs: List[Dict[str, Any]] = []
+        jobs: List[JobRecord] = []
         # candidate_count to inspect per source
         candidate_count = self.max_scrape_limit * max(1, int(self.per_source_multiplier))
         
@@ -189,7 +573,7 @@ class JobScraper:
                 logger.debug(f"WeWorkRemotely fallback failed: {e}")
         return jobs
     
-    def _scrape_indeed_jobs(self, base_url: str, search_params: str) -> List[Dict[str, Any]]:
+    def _scrape_indeed_jobs(self, base_url: str, search_params: str) -> List[JobRecord]:
         """Scrape jobs from Indeed"""
         
         logger.info("Scraping Indeed jobs...")
@@ -204,24 +588,7 @@ class JobScraper:
             response = self.session.get(base_url, params=params, timeout=10)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Find job listings (Indeed structure)
-            job_cards = soup.find_all('div', class_=['job_seen_beacon', 'slider_container'])
-            
-            for card in job_cards:
-                if self.scraped_count >= self.max_scrape_limit:
-                    break
-                
-                try:
-                    job = self._extract_indeed_job_data(card, base_url)
-                    if job:
-                        jobs.append(job)
-                        self.scraped_count += 1
-                        
-                except Exception as e:
-                    logger.debug(f"Error extracting job from Indeed card: {e}")
-                    continue
+            jobs = self._parse_indeed_jobs(response.content, base_url)
             
         except Exception as e:
             logger.error(f"Error scraping Indeed: {e}")
@@ -229,7 +596,32 @@ class JobScraper:
         logger.info(f"Scraped {len(jobs)} jobs from Indeed")
         return jobs
     
-    def _scrape_remoteok_jobs(self, base_url: str = None, candidate_limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    def _parse_indeed_jobs(self, content: bytes, base_url: str) -> List[JobRecord]:
+        """Extract jobs from an Indeed search results page"""
+        
+        jobs = []
+        soup = BeautifulSoup(content, HTML_PARSER)
+        
+        # Find job listings (Indeed structure)
+        job_cards = soup.find_all('div', class_=['job_seen_beacon', 'slider_container'])
+        
+        for card in job_cards:
+            if self.scraped_count >= self.max_scrape_limit:
+                break
+            
+            try:
+                job = self._extract_indeed_job_data(card, base_url)
+                if job:
+                    jobs.append(job)
+                    self.scraped_count += 1
+            
+            except Exception as e:
+                logger.debug(f"Error extracting job from Indeed card: {e}")
+                continue
+        
+        return jobs
+    
+    def _scrape_remoteok_jobs(self, base_url: str = None, candidate_limit: Optional[int] = None) -> List[JobRecord]:
         """Scrape jobs from RemoteOK using their API
         
         candidate_limit: how many RemoteOK items to inspect (not how many to append).
@@ -241,53 +633,11 @@ class JobScraper:
         
         try:
             # RemoteOK has a public JSON API
-            api_url = "https://remoteok.com/api/?location=Worldwide"
-            
-            # Add headers to mimic browser
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36',
-                'Accept': 'application/json, text/html',
-                'Accept-Language': 'en-GB,en;q=0.9'
-            }
-            
-            response = self.session.get(api_url, headers=headers, timeout=15)
+            response = self.session.get(REMOTEOK_API_URL, headers=REMOTEOK_HEADERS, timeout=15)
             response.raise_for_status()
             
-            job_data = response.json()
-            
-            # First item is metadata/legal notice, skip it
-            if isinstance(job_data, list) and len(job_data) > 0:
-                if 'legal' in job_data[0] or 'last_updated' in job_data[0]:
-                    job_data = job_data[1:]  # Skip metadata
-            
-            logger.info(f"Found {len(job_data)} jobs from RemoteOK API")
-            
-            # Determine how many candidates to inspect
-            if candidate_limit is None:
-                candidate_limit = self.max_scrape_limit * max(1, int(self.per_source_multiplier))
-            candidate_limit = min(len(job_data), int(candidate_limit))
-            
-            inspected = 0
-            for item in job_data:
-                if inspected >= candidate_limit:
-                    break
-                inspected += 1
-                
-                # stop early if we've already collected enough valid jobs
-                if self.scraped_count >= self.max_scrape_limit:
-                    break
-                
-                try:
-                    job = self._extract_remoteok_job_data(item)
-                    if job:
-                        jobs.append(job)
-                        self.scraped_count += 1
-                        
-                except Exception as e:
-                    logger.debug(f"Error extracting RemoteOK job: {e}")
-                    continue
-            
-            logger.info(f"Inspected {inspected} RemoteOK candidates, appended {len(jobs)} jobs")
+            # orjson (when installed) decodes the multi-MB payload straight from bytes
+            jobs = self._parse_remoteok_jobs(loads(response.content), candidate_limit)
             
         except Exception as e:
             logger.error(f"Error scraping RemoteOK: {e}")
@@ -295,7 +645,47 @@ class JobScraper:
         logger.info(f"Successfully scraped {len(jobs)} jobs from RemoteOK")
         return jobs
     
-    def _scrape_weworkremotely_jobs(self, base_url: str = None, candidate_limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    def _parse_remoteok_jobs(self, job_data: List[Dict[str, Any]], candidate_limit: Optional[int] = None) -> List[JobRecord]:
+        """Extract jobs from a decoded RemoteOK API response"""
+        
+        jobs = []
+        
+        # First item is metadata/legal notice, skip it (by offset, not by copying the list)
+        skip = 0
+        if isinstance(job_data, list) and len(job_data) > 0:
+            if 'legal' in job_data[0] or 'last_updated' in job_data[0]:
+                skip = 1
+        available = len(job_data) - skip
+        
+        logger.info(f"Found {available} jobs from RemoteOK API")
+        
+        # Determine how many candidates to inspect
+        if candidate_limit is None:
+            candidate_limit = self.max_scrape_limit * max(1, int(self.per_source_multiplier))
+        candidate_limit = min(available, int(candidate_limit))
+        
+        inspected = 0
+        for item in itertools.islice(job_data, skip, skip + candidate_limit):
+            inspected += 1
+            
+            # stop early if we've already collected enough valid jobs
+            if self.scraped_count >= self.max_scrape_limit:
+                break
+            
+            try:
+                job = self._extract_remoteok_job_data(item)
+                if job:
+                    jobs.append(job)
+                    self.scraped_count += 1
+            
+            except Exception as e:
+                logger.debug(f"Error extracting RemoteOK job: {e}")
+                continue
+        
+        logger.info(f"Inspected {inspected} RemoteOK candidates, appended {len(jobs)} jobs")
+        return jobs
+    
+    def _scrape_weworkremotely_jobs(self, base_url: str = None, candidate_limit: Optional[int] = None) -> List[JobRecord]:
         """Scrape jobs from We Work Remotely
         
         candidate_limit: number of list items to inspect (not guaranteed appends).
@@ -307,46 +697,11 @@ class JobScraper:
         
         try:
             # We Work Remotely URL for worldwide remote jobs
-            wwr_url = "https://weworkremotely.com/100-percent-remote-jobs"
-            
-            # Headers to mimic browser
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/137.0.0.0 Safari/137.0.0.0',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-GB,en;q=0.9',
-                'Referer': 'https://www.google.com/'
-            }
-            
-            response = self.session.get(wwr_url, headers=headers, timeout=15)
+            response = self.session.get(WWR_URL, headers=WWR_HEADERS, timeout=15)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Determine candidate limit
-            if candidate_limit is None:
-                candidate_limit = self.max_scrape_limit * max(1, int(self.per_source_multiplier))
-            job_items = soup.find_all('li', class_=re.compile(r'listing|job|feature|new-listing'), limit=int(candidate_limit))
-            logger.info(f"Found {len(job_items)} potential listings on WeWorkRemotely (limited to {candidate_limit})")
-            
-            inspected = 0
-            for item in job_items:
-                if inspected >= int(candidate_limit):
-                    break
-                inspected += 1
-                
-                if self.scraped_count >= self.max_scrape_limit:
-                    break
-                
-                try:
-                    job = self._extract_weworkremotely_job_data(item)
-                    if job:
-                        jobs.append(job)
-                        self.scraped_count += 1
-                except Exception as e:
-                    logger.debug(f"Error extracting WWR job data: {e}")
-                    continue
-            
-            logger.info(f"Inspected {inspected} WWR candidates, appended {len(jobs)} jobs")
+            jobs = self._parse_weworkremotely_jobs(response.content, candidate_limit)
+            self._fill_weworkremotely_descriptions(jobs)
             
         except Exception as e:
             logger.error(f"Error scraping We Work Remotely: {e}")
@@ -354,88 +709,199 @@ class JobScraper:
         logger.info(f"Successfully scraped {len(jobs)} jobs from We Work Remotely")
         return jobs
     
-    def _extract_weworkremotely_job_data(self, job_item) -> Optional[Dict[str, Any]]:
+    def _parse_weworkremotely_jobs(self, content: bytes, candidate_limit: Optional[int] = None) -> List[JobRecord]:
+        """Extract jobs from a We Work Remotely listing page"""
+        
+        jobs = []
+        
+        # Determine candidate limit
+        if candidate_limit is None:
+            candidate_limit = self.max_scrape_limit * max(1, int(self.per_source_multiplier))
+        if SELECTOLAX_AVAILABLE:
+            job_items = _css_unique(HTMLParser(content), WWR_LISTING_CSS)[:int(candidate_limit)]
+            extract = self._extract_weworkremotely_node_data
+        else:
+            soup = BeautifulSoup(content, HTML_PARSER)
+            job_items = soup.find_all('li', class_=_RE_LISTING, limit=int(candidate_limit))
+            extract = self._extract_weworkremotely_job_data
+        logger.info(f"Found {len(job_items)} potential listings on WeWorkRemotely (limited to {candidate_limit})")
+        
+        inspected = 0
+        for item in job_items:
+            if inspected >= int(candidate_limit):
+                break
+            inspected += 1
+            
+            if self.scraped_count >= self.max_scrape_limit:
+                break
+            
+            try:
+                job = extract(item)
+                if job:
+                    jobs.append(job)
+                    self.scraped_count += 1
+            except Exception as e:
+                logger.debug(f"Error extracting WWR job data: {e}")
+                continue
+        
+        logger.info(f"Inspected {inspected} WWR candidates, appended {len(jobs)} jobs")
+        return jobs
+    
+    def _fill_weworkremotely_descriptions(self, jobs: List[JobRecord]):
+        """Replace placeholder descriptions with the text of each WWR job page"""
+        
+        if not jobs or not self.fetch_wwr_descriptions or not AIOHTTP_AVAILABLE:
+            return
+        
+        try:
+            asyncio.run(self._fetch_weworkremotely_descriptions(jobs))
+        except Exception as e:
+            logger.error(f"Error fetching We Work Remotely job pages: {e}")
+    
+    async def _fetch_weworkremotely_descriptions(self, jobs: List[JobRecord],
+                                                 session: Optional['aiohttp.ClientSession'] = None):
+        """Fetch WWR job pages concurrently and fill in job_description where one is found"""
+        
+        if session is None:
+            async with self._open_async_session() as own_session:
+                return await self._fetch_weworkremotely_descriptions(jobs, own_session)
+        
+        # One extra GET per listing, all against weworkremotely.com: pace them per host
+        sem = asyncio.BoundedSemaphore(min(self.scrape_concurrency, self.wwr_detail_concurrency))
+        timeout = aiohttp.ClientTimeout(total=15)
+        
+        async def fetch_page(url: str) -> bytes:
+            async with sem:
+                async with session.get(url, headers=WWR_HEADERS, timeout=timeout) as response:
+                    response.raise_for_status()
+                    return await response.read()
+        
+        pages = await asyncio.gather(*(fetch_page(job.job_link) for job in jobs), return_exceptions=True)
+        
+        filled = 0
+        for job, page in zip(jobs, pages):
+            if isinstance(page, Exception):
+                logger.debug(f"Error fetching WWR job page {job.job_link}: {page}")
+                continue
+            description = self._extract_description_from_html(page)
+            if description:
+                job.job_description = description
+                filled += 1
+        
+        logger.info(f"Fetched full descriptions for {filled}/{len(jobs)} WWR jobs")
+    
+    def _extract_weworkremotely_job_data(self, job_item) -> Optional[JobRecord]:
         """Extract job data from We Work Remotely listing"""
         
         try:
             # Find the link element
-            link_elem = job_item.find('a')
+            link_elem = job_item.select_one('a')
             if not link_elem:
                 return None
             
-            job_url = f"https://weworkremotely.com{link_elem.get('href', '')}"
-            
             # Find the new-listing div
-            listing_div = job_item.find('div', class_='new-listing')
+            listing_div = job_item.select_one('div.new-listing')
             if not listing_div:
                 return None
             
-            # Extract job title
-            title_elem = listing_div.find('h3', class_='new-listing__header__title')
-            job_title = title_elem.get_text().strip() if title_elem else 'Unknown Title'
-            
-            # Extract company name
-            company_elem = listing_div.find('p', class_='new-listing__company-name')
-            company_name = 'Unknown Company'
-            if company_elem:
-                # Remove the icon and get just the text
-                company_text = company_elem.get_text().strip()
-                # Clean up any extra whitespace
-                company_name = ' '.join(company_text.split())
-            
-            # Extract location/headquarters
-            location_elem = listing_div.find('p', class_='new-listing__company-headquarters')
-            location = 'Remote'
-            if location_elem:
-                location_text = location_elem.get_text().strip()
-                # Remove the location icon and clean up
-                location = ' '.join(location_text.split())
-            
-            # Extract categories (job type, salary, etc.)
-            categories_div = listing_div.find('div', class_='new-listing__categories')
-            employment_type = 'Full-Time'
-            salary_range = ''
-            job_location = 'Anywhere in the World'
-            
-            if categories_div:
-                category_items = categories_div.find_all('p', class_='new-listing__categories__category')
-                for cat in category_items:
-                    cat_text = cat.get_text().strip()
-                    # Check if it's a salary range
-                    if '$' in cat_text or 'USD' in cat_text:
-                        salary_range = cat_text
-                    # Check if it's employment type
-                    elif 'time' in cat_text.lower() or 'contract' in cat_text.lower():
-                        employment_type = cat_text
-                    # Check if it's location
-                    elif 'anywhere' in cat_text.lower() or 'world' in cat_text.lower():
-                        job_location = cat_text
-            
-            # Generate unique job ID
-            job_id = self._generate_job_id(job_title, company_name, 'wwr')
-            
-            # Build job description placeholder (would need to visit job page for full description)
-            job_description = f"Remote position: {job_title} at {company_name}. Location: {job_location}. Visit the job posting for full details."
-            
-            return {
-                'job_id': job_id,
-                'job_title': job_title,
-                'company_name': company_name,
-                'company_address': job_item.get('company_logo', ''),
-                'job_link': job_url,
-                'location': job_location,
-                'country': 'Remote',
-                'employment_type': employment_type,
-                'posted_date': '',
-                'job_description': job_description,
-                'salary_range': salary_range
-            }
+            # Same selectors as the selectolax variant, one CSS lookup each
+            select_one = listing_div.select_one
+            title_elem = select_one('h3.new-listing__header__title')
+            company_elem = select_one('p.new-listing__company-name')
+            categories_div = select_one('div.new-listing__categories')
+            category_items = categories_div.select('p.new-listing__categories__category') if categories_div else []
+            
+            return self._build_weworkremotely_job(
+                href=link_elem.get('href', ''),
+                title_text=title_elem.get_text() if title_elem else None,
+                company_text=company_elem.get_text() if company_elem else None,
+                category_texts=[cat.get_text() for cat in category_items],
+                company_logo=job_item.get('company_logo', '')
+            )
             
         except Exception as e:
             logger.debug(f"Error extracting We Work Remotely job data: {e}")
             return None
     
-    def _scrape_generic_jobs(self, base_url: str, search_params: str) -> List[Dict[str, Any]]:
+    def _extract_weworkremotely_node_data(self, job_item) -> Optional[JobRecord]:
+        """selectolax variant of _extract_weworkremotely_job_data"""
+        
+        try:
+            link_elem = job_item.css_first('a')
+            if not link_elem:
+                return None
+            
+            listing_div = job_item.css_first('div.new-listing')
+            if not listing_div:
+                return None
+            
+            title_elem = listing_div.css_first('h3.new-listing__header__title')
+            company_elem = listing_div.css_first('p.new-listing__company-name')
+            category_items = listing_div.css('div.new-listing__categories p.new-listing__categories__category')
+            
+            return self._build_weworkremotely_job(
+                href=link_elem.attributes.get('href') or '',
+                title_text=title_elem.text() if title_elem else None,
+                company_text=company_elem.text() if company_elem else None,
+                category_texts=[cat.text() for cat in category_items],
+                company_logo=job_item.attributes.get('company_logo') or ''
+            )
+            
+        except Exception as e:
+            logger.debug(f"Error extracting We Work Remotely job data: {e}")
+            return None
+    
+    def _build_weworkremotely_job(self, href: str, title_text: Optional[str], company_text: Optional[str],
+                                  category_texts: List[str], company_logo: str) -> JobRecord:
+        """Build a job record from the raw texts of a We Work Remotely listing"""
+        
+        job_url = f"https://weworkremotely.com{href}"
+        job_title = title_text.strip() if title_text is not None else 'Unknown Title'
+        
+        company_name = 'Unknown Company'
+        if company_text is not None:
+            # Remove the icon and clean up any extra whitespace
+            company_name = _RE_WHITESPACE.sub(' ', company_text).strip()
+        
+        # Categories carry job type, salary and location
+        employment_type = 'Full-Time'
+        salary_range = ''
+        job_location = 'Anywhere in the World'
+        
+        for cat_text in category_texts:
+            cat_text = cat_text.strip()
+            cat_lower = cat_text.lower()
+            # Check if it's a salary range
+            if '$' in cat_text or 'USD' in cat_text:
+                salary_range = cat_text
+            # Check if it's employment type
+            elif 'time' in cat_lower or 'contract' in cat_lower:
+                employment_type = cat_text
+            # Check if it's location
+            elif 'anywhere' in cat_lower or 'world' in cat_lower:
+                job_location = cat_text
+        
+        # Generate unique job ID
+        job_id = self._generate_job_id(job_title, company_name, 'wwr')
+        
+        # Placeholder until the job page is fetched (see _fill_weworkremotely_descriptions)
+        job_description = f"Remote position: {job_title} at {company_name}. Location: {job_location}. Visit the job posting for full details."
+        
+        return JobRecord(
+            job_id=job_id,
+            job_title=job_title,
+            company_name=company_name,
+            company_address=company_logo,
+            job_link=job_url,
+            location=job_location,
+            country='Remote',
+            employment_type=employment_type,
+            posted_date='',
+            job_description=job_description,
+            salary_range=salary_range
+        )
+    
+    def _scrape_generic_jobs(self, base_url: str, search_params: str) -> List[JobRecord]:
         """Generic job scraping for unknown sites"""
         
         logger.info(f"Using generic scraping for {base_url}")
@@ -448,24 +914,7 @@ class JobScraper:
             response = self.session.get(base_url, params=params, timeout=10)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Look for common job listing patterns
-            potential_jobs = soup.find_all(['div', 'article', 'li'], class_=re.compile(r'job|listing|card'))
-            
-            for element in potential_jobs:
-                if self.scraped_count >= self.max_scrape_limit:
-                    break
-                
-                try:
-                    job = self._extract_generic_job_data(element, base_url)
-                    if job:
-                        jobs.append(job)
-                        self.scraped_count += 1
-                        
-                except Exception as e:
-                    logger.debug(f"Error extracting generic job: {e}")
-                    continue
+            jobs = self._parse_generic_jobs(response.content, base_url)
             
         except Exception as e:
             logger.error(f"Error in generic scraping: {e}")
@@ -473,6 +922,36 @@ class JobScraper:
         logger.info(f"Scraped {len(jobs)} jobs using generic method")
         return jobs
     
+    def _parse_generic_jobs(self, content: bytes, base_url: str) -> List[JobRecord]:
+        """Extract jobs from an arbitrary listing page using common patterns"""
+        
+        jobs = []
+        
+        # Look for common job listing patterns
+        if SELECTOLAX_AVAILABLE:
+            potential_jobs = _css_unique(HTMLParser(content), GENERIC_LISTING_CSS)
+            extract = self._extract_generic_node_data
+        else:
+            soup = BeautifulSoup(content, HTML_PARSER)
+            potential_jobs = soup.find_all(['div', 'article', 'li'], class_=_RE_GENERIC_JOB)
+            extract = self._extract_generic_job_data
+        
+        for element in potential_jobs:
+            if self.scraped_count >= self.max_scrape_limit:
+                break
+            
+            try:
+                job = extract(element, base_url)
+                if job:
+                    jobs.append(job)
+                    self.scraped_count += 1
+            
+            except Exception as e:
+                logger.debug(f"Error extracting generic job: {e}")
+                continue
+        
+        return jobs
+    
     def _parse_search_params(self, search_params: str) -> Dict[str, str]:
         """Parse search parameters string into dictionary"""
         
@@ -490,20 +969,20 @@ class JobScraper:
         
         return params
     
-    def _extract_indeed_job_data(self, card_element, base_url: str) -> Optional[Dict[str, Any]]:
+    def _extract_indeed_job_data(self, card_element, base_url: str) -> Optional[JobRecord]:
         """Extract job data from Indeed job card"""
         
         try:
             # Extract title
-            title_elem = card_element.find('h2') or card_element.find('a', class_=re.compile(r'title'))
+            title_elem = card_element.find('h2') or card_element.find('a', class_=_RE_TITLE)
             title = title_elem.get_text().strip() if title_elem else 'Unknown Title'
             
             # Extract company
-            company_elem = card_element.find('span', class_=re.compile(r'company')) or card_element.find('div', class_=re.compile(r'company'))
+            company_elem = card_element.find('span', class_=_RE_COMPANY) or card_element.find('div', class_=_RE_COMPANY)
             company = company_elem.get_text().strip() if company_elem else 'Unknown Company'
             
             # Extract location
-            location_elem = card_element.find('div', class_=re.compile(r'location'))
+            location_elem = card_element.find('div', class_=_RE_LOCATION)
             location = location_elem.get_text().strip() if location_elem else 'Unknown Location'
             
             # Extract job link
@@ -515,25 +994,25 @@ class JobScraper:
             # Generate job ID
             job_id = self._generate_job_id(title, company, 'indeed')
             
-            return {
-                'job_id': job_id,
-                'job_title': title,
-                'company_name': company,
-                'company_address': location,
-                'job_link': job_link,
-                'location': location,
-                'country': self._extract_country_from_location(location),
-                'employment_type': 'Full-time',
-                'posted_date': '',
-                'job_description': f'Job posting from Indeed for {title} at {company}',
-                'salary_range': ''
-            }
+            return JobRecord(
+                job_id=job_id,
+                job_title=title,
+                company_name=company,
+                company_address=location,
+                job_link=job_link,
+                location=location,
+                country=self._extract_country_from_location(location),
+                employment_type='Full-time',
+                posted_date='',
+                job_description=f'Job posting from Indeed for {title} at {company}',
+                salary_range=''
+            )
             
         except Exception as e:
             logger.debug(f"Error extracting Indeed job data: {e}")
             return None
     
-    def _extract_remoteok_job_data(self, job_item: Dict) -> Optional[Dict[str, Any]]:
+    def _extract_remoteok_job_data(self, job_item: Dict) -> Optional[JobRecord]:
         """Extract job data from RemoteOK API response"""
         
         try:
@@ -544,104 +1023,118 @@ class JobScraper:
                 'remoteok'
             )
             
-            return {
-                'job_id': job_id,
-                'job_title': job_item.get('position', 'Unknown Title'),
-                'company_name': job_item.get('company', 'Unknown Company'),
-                'company_address': job_item.get('company_logo', ''),
-                'job_link': f"https://remoteok.io/remote-jobs/{job_item.get('id', '')}",
-                'location': 'Remote',
-                'country': 'Remote',
-                'employment_type': 'Remote',
-                'posted_date': job_item.get('date', ''),
-                'job_description': job_item.get('description', ''),
-                'salary_range': f"${job_item.get('salary_min', '')}-${job_item.get('salary_max', '')}" if job_item.get('salary_min') else ''
-            }
+            return JobRecord(
+                job_id=job_id,
+                job_title=job_item.get('position', 'Unknown Title'),
+                company_name=job_item.get('company', 'Unknown Company'),
+                company_address=job_item.get('company_logo', ''),
+                job_link=f"https://remoteok.io/remote-jobs/{job_item.get('id', '')}",
+                location='Remote',
+                country='Remote',
+                employment_type='Remote',
+                posted_date=job_item.get('date', ''),
+                job_description=job_item.get('description', ''),
+                salary_range=f"${job_item.get('salary_min', '')}-${job_item.get('salary_max', '')}" if job_item.get('salary_min') else ''
+            )
             
         except Exception as e:
             logger.debug(f"Error extracting RemoteOK job data: {e}")
             return None
     
-    def _extract_generic_job_data(self, element, base_url: str) -> Optional[Dict[str, Any]]:
+    def _extract_generic_job_data(self, element, base_url: str) -> Optional[JobRecord]:
         """Extract job data using generic patterns"""
         
         try:
             # Try to find title
             title_elem = (element.find('h1') or element.find('h2') or element.find('h3') or 
-                         element.find('a') or element.find(class_=re.compile(r'title|job-title')))
+                         element.find('a') or element.find(class_=_RE_TITLE))
             title = title_elem.get_text().strip() if title_elem else 'Generic Job'
             
             # Try to find company
-            company_elem = element.find(class_=re.compile(r'company|employer'))
+            company_elem = element.find(class_=_RE_COMPANY_OR_EMPLOYER)
             company = company_elem.get_text().strip() if company_elem else 'Unknown Company'
             
             # Try to find location
-            location_elem = element.find(class_=re.compile(r'location|address'))
+            location_elem = element.find(class_=_RE_LOCATION_OR_ADDRESS)
             location = location_elem.get_text().strip() if location_elem else 'Unknown Location'
             
             # Try to find link
             link_elem = element.find('a')
-            job_link = ''
-            if link_elem and link_elem.get('href'):
-                job_link = urljoin(base_url, link_elem['href'])
+            href = link_elem.get('href') if link_elem else None
             
-            # Only return if we found meaningful data
-            if len(title) > 3 and len(company) > 3:
-                job_id = self._generate_job_id(title, company, 'generic')
-                
-                return {
-                    'job_id': job_id,
-                    'job_title': title,
-                    'company_name': company,
-                    'company_address': location,
-                    'job_link': job_link or base_url,
-                    'location': location,
-                    'country': self._extract_country_from_location(location),
-                    'employment_type': 'Full-time',
-                    'posted_date': '',
-                    'job_description': f'Job posting scraped from {urlparse(base_url).netloc}',
-                    'salary_range': ''
-                }
+            return self._build_generic_job(title, company, location, href, base_url)
             
+        except Exception as e:
+            logger.debug(f"Error extracting generic job data: {e}")
             return None
+    
+    def _extract_generic_node_data(self, element, base_url: str) -> Optional[JobRecord]:
+        """selectolax variant of _extract_generic_job_data"""
+        
+        try:
+            title_elem = (element.css_first('h1') or element.css_first('h2') or element.css_first('h3') or
+                          element.css_first('a') or _css_first_descendant(element, '[class*="title"]'))
+            title = title_elem.text().strip() if title_elem else 'Generic Job'
+            
+            company_elem = _css_first_descendant(element, '[class*="company"], [class*="employer"]')
+            company = company_elem.text().strip() if company_elem else 'Unknown Company'
+            
+            location_elem = _css_first_descendant(element, '[class*="location"], [class*="address"]')
+            location = location_elem.text().strip() if location_elem else 'Unknown Location'
+            
+            link_elem = element.css_first('a')
+            href = link_elem.attributes.get('href') if link_elem else None
+            
+            return self._build_generic_job(title, company, location, href, base_url)
             
         except Exception as e:
             logger.debug(f"Error extracting generic job data: {e}")
             return None
     
+    def _build_generic_job(self, title: str, company: str, location: str,
+                           href: Optional[str], base_url: str) -> Optional[JobRecord]:
+        """Build a generic job record, or None when title/company look meaningless"""
+        
+        job_link = urljoin(base_url, href) if href else ''
+        
+        # Only return if we found meaningful data
+        if len(title) > 3 and len(company) > 3:
+            job_id = self._generate_job_id(title, company, 'generic')
+            
+            return JobRecord(
+                job_id=job_id,
+                job_title=title,
+                company_name=company,
+                company_address=location,
+                job_link=job_link or base_url,
+                location=location,
+                country=self._extract_country_from_location(location),
+                employment_type='Full-time',
+                posted_date='',
+                job_description=f'Job posting scraped from {urlparse(base_url).netloc}',
+                salary_range=''
+            )
+        
+        return None
+    
     def _generate_job_id(self, title: str, company: str, source: str) -> str:
         """Generate unique job ID from title, company, and source"""
-        
-        # Create a hash from the combination
-        content = f"{title}_{company}_{source}".lower()
-        hash_obj = hashlib.md5(content.encode())
-        
-        return f"{source}_{hash_obj.hexdigest()[:8]}"
+        return _job_id(title, company, source)
     
     def _extract_country_from_location(self, location: str) -> str:
         """Extract country from location string"""
         
         location_lower = location.lower()
         
-        # Common country patterns
-        country_mapping = {
-            'usa': 'United States',
-            'us': 'United States',
-            'united states': 'United States',
-            'uk': 'United Kingdom',
-            'united kingdom': 'United Kingdom',
-            'canada': 'Canada',
-            'australia': 'Australia',
-            'germany': 'Germany',
-            'france': 'France',
-            'netherlands': 'Netherlands',
-            'singapore': 'Singapore',
-            'remote': 'Remote'
-        }
+        # Most locations end with the country ("Berlin, Germany"): try that token exactly first
+        country = COUNTRY_MAPPING.get(location_lower.rsplit(',', 1)[-1].strip())
+        if country:
+            return country
         
-        for key, country in country_mapping.items():
-            if key in location_lower:
-                return country
+        # Common country patterns
+        matched = _COUNTRY_MATCHER.find(location_lower)
+        if matched:
+            return min(matched)[1]
         
         # If no match, try to extract last part after comma
         parts = location.split(',')
@@ -652,54 +1145,29 @@ class JobScraper:
         
         return 'Unknown'
     
-    def _deduplicate_jobs(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _deduplicate_jobs(self, jobs: List[JobRecord]) -> List[JobRecord]:
         """Remove duplicate jobs based on job_id and title+company combination"""
         
-        seen_ids = set()
-        seen_combinations = set()
+        # One set holds both key kinds: str job IDs and (title, company) tuples never collide
+        seen = set()
         unique_jobs = []
         
         for job in jobs:
-            job_id = job.get('job_id', '')
-            title = job.get('job_title', '').lower().strip()
-            company = job.get('company_name', '').lower().strip()
-            combination = f"{title}_{company}"
-            
-            if job_id not in seen_ids and combination not in seen_combinations:
-                seen_ids.add(job_id)
-                seen_combinations.add(combination)
+            job_id = job.job_id
+            combination = (job.job_title.lower().strip(), job.company_name.lower().strip())
+            
+            if job_id not in seen and combination not in seen:
+                seen.add(job_id)
+                seen.add(combination)
                 unique_jobs.append(job)
         
         logger.info(f"Deduplicated {len(jobs)} jobs down to {len(unique_jobs)} unique jobs")
         return unique_jobs
     
-    def _validate_scraped_jobs(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _validate_scraped_jobs(self, jobs: List[JobRecord]) -> List[JobRecord]:
         """Validate scraped jobs and filter out invalid ones"""
         
-        valid_jobs = []
-        
-        for job in jobs:
-            # Check required fields
-            if (job.get('job_title') and len(job.get('job_title', '')) > 2 and
-                job.get('company_name') and len(job.get('company_name', '')) > 2 and
-                job.get('job_id')):
-                
-                # Clean up the data
-                job['job_title'] = job['job_title'].strip()
-                job['company_name'] = job['company_name'].strip()
-                job['location'] = job.get('location', '').strip()
-                
-                # Ensure all required fields exist
-                required_fields = [
-                    'job_id', 'job_title', 'company_name', 'job_link', 'location', 
-                    'country', 'job_description'
-                ]
-                
-                for field in required_fields:
-                    if field not in job:
-                        job[field] = ''
-                
-                valid_jobs.append(job)
+        valid_jobs = [_clean_job(job) for job in jobs if _is_valid_job(job)]
         
         logger.info(f"Validated {len(valid_jobs)} out of {len(jobs)} scraped jobs")
         return valid_jobs
@@ -707,26 +1175,31 @@ class JobScraper:
     def scrape_job_from_url(self, job_url: str) -> Optional[Dict[str, Any]]:
         """Scrape a single job from a specific URL"""
         
+        cached = self._get_cached_url_job(job_url)
+        if cached is not None:
+            logger.info(f"Using cached job for URL: {job_url}")
+            return cached
+        
         logger.info(f"Scraping single job from URL: {job_url}")
         
         try:
             response = self.session.get(job_url, timeout=10)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            tree = self._parse_page(response.content)
             
             # Try to extract job data using generic patterns
             job_data = {
                 'job_id': self._generate_job_id('url_job', 'unknown', 'manual'),
-                'job_title': self._extract_title_from_page(soup),
-                'company_name': self._extract_company_from_page(soup),
+                'job_title': self._extract_title_from_page(tree),
+                'company_name': self._extract_company_from_page(tree),
                 'company_address': '',
                 'job_link': job_url,
-                'location': self._extract_location_from_page(soup),
+                'location': self._extract_location_from_page(tree),
                 'country': 'Unknown',
                 'employment_type': 'Full-time',
                 'posted_date': '',
-                'job_description': self._extract_description_from_page(soup),
+                'job_description': self._extract_description_from_page(tree),
                 'salary_range': ''
             }
             
@@ -736,6 +1209,7 @@ class JobScraper:
             # Validate the extracted data
             if job_data['job_title'] and job_data['company_name']:
                 logger.info(f"Successfully scraped job: {job_data['job_title']} at {job_data['company_name']}")
+                self._cache_url_job(job_url, job_data)
                 return job_data
             else:
                 logger.warning("Could not extract sufficient job data from URL")
@@ -745,88 +1219,124 @@ class JobScraper:
             logger.error(f"Error scraping job from URL {job_url}: {e}")
             return None
     
-    def _extract_title_from_page(self, soup: BeautifulSoup) -> str:
+    def _load_url_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Return the per-URL cache, reading the cache file only once"""
+        
+        if self._url_cache is None:
+            self._url_cache = {}
+            if URL_CACHE_PATH.exists():
+                try:
+                    cached = load_json(URL_CACHE_PATH)
+                    # Oldest first, so eviction can drop entries from the front
+                    self._url_cache = dict(sorted(cached.items(), key=lambda item: item[1].get('cached_at', 0)))
+                    self._prune_url_cache()
+                except Exception as e:
+                    logger.warning(f"Ignoring unreadable scrape cache {URL_CACHE_PATH}: {e}")
+        return self._url_cache
+    
+    def _prune_url_cache(self):
+        """Drop expired entries, then the oldest ones beyond URL_CACHE_MAX_ENTRIES"""
+        
+        cutoff = time.time() - URL_CACHE_TTL_SECONDS
+        cache = self._url_cache
+        for url in [url for url, entry in cache.items() if entry.get('cached_at', 0) <= cutoff]:
+            del cache[url]
+        for url in list(itertools.islice(cache, max(0, len(cache) - URL_CACHE_MAX_ENTRIES))):
+            del cache[url]
+    
+    def _get_cached_url_job(self, job_url: str) -> Optional[Dict[str, Any]]:
+        """Copy of a fresh cached result for job_url, or None"""
+        
+        entry = self._load_url_cache().get(job_url)
+        if entry and time.time() - entry.get('cached_at', 0) < URL_CACHE_TTL_SECONDS:
+            return dict(entry['job'])
+        return None
+    
+    def _cache_url_job(self, job_url: str, job_data: Dict[str, Any]):
+        """Remember a successful scrape in memory and on disk (failures are not cached)"""
+        
+        cache = self._load_url_cache()
+        # Re-insert so the dict stays ordered oldest to newest
+        cache.pop(job_url, None)
+        cache[job_url] = {'cached_at': time.time(), 'job': dict(job_data)}
+        self._prune_url_cache()
+        try:
+            URL_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            write_json(URL_CACHE_PATH, cache)
+        except Exception as e:
+            logger.warning(f"Could not persist scrape cache: {e}")
+    
+    def _parse_page(self, content: bytes):
+        """Parse a fetched page with selectolax when available, then lxml, else BeautifulSoup"""
+        
+        if SELECTOLAX_AVAILABLE:
+            try:
+                return HTMLParser(content)
+            except Exception as e:
+                logger.debug(f"selectolax could not parse page: {e}")
+        if LXML_AVAILABLE:
+            try:
+                return lxml_html.fromstring(content)
+            except Exception as e:
+                logger.debug(f"lxml could not parse page: {e}")
+        return BeautifulSoup(content, HTML_PARSER)
+    
+    def _extract_title_from_page(self, tree) -> str:
         """Extract job title from page"""
         
         # Try multiple selectors
-        selectors = [
-            'h1',
-            '.job-title',
-            '.jobTitle',
-            '[class*="title"]',
-            'title'
-        ]
-        
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element:
-                title = element.get_text().strip()
+        for selector in TITLE_CSS:
+            text = _first_text(tree, selector)
+            if text is not None:
+                title = text.strip()
                 if len(title) > 3 and len(title) < 100:
                     return title
         
         return 'Unknown Job Title'
     
-    def _extract_company_from_page(self, soup: BeautifulSoup) -> str:
+    def _extract_company_from_page(self, tree) -> str:
         """Extract company name from page"""
         
-        selectors = [
-            '.company-name',
-            '.companyName',
-            '[class*="company"]',
-            '[data-testid*="company"]'
-        ]
-        
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element:
-                company = element.get_text().strip()
+        for selector in COMPANY_CSS:
+            text = _first_text(tree, selector)
+            if text is not None:
+                company = text.strip()
                 if len(company) > 2 and len(company) < 50:
                     return company
         
         return 'Unknown Company'
     
-    def _extract_location_from_page(self, soup: BeautifulSoup) -> str:
+    def _extract_location_from_page(self, tree) -> str:
         """Extract location from page"""
         
-        selectors = [
-            '.location',
-            '.job-location',
-            '[class*="location"]',
-            '[data-testid*="location"]'
-        ]
-        
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element:
-                location = element.get_text().strip()
+        for selector in LOCATION_CSS:
+            text = _first_text(tree, selector)
+            if text is not None:
+                location = text.strip()
                 if len(location) > 2:
                     return location
         
         return 'Unknown Location'
     
-    def _extract_description_from_page(self, soup: BeautifulSoup) -> str:
+    def _extract_description_from_page(self, tree) -> str:
         """Extract job description from page"""
         
-        selectors = [
-            '.job-description',
-            '.jobDescription',
-            '[class*="description"]',
-            '.content',
-            'main',
-            '.job-details'
-        ]
-        
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element:
-                # Get text and clean it up
-                description = element.get_text()
-                description = re.sub(r'\s+', ' ', description).strip()
+        for selector in DESCRIPTION_CSS:
+            text = _first_text(tree, selector, DESCRIPTION_TEXT_LIMIT)
+            if text is not None:
+                # Get text and collapse whitespace (str.split beats the regex on page-sized text)
+                description = ' '.join(text.split())
                 if len(description) > 100:  # Reasonable description length
                     return description[:5000]  # Limit length
         
         return 'Job description not available'
     
+    def _extract_description_from_html(self, content: bytes) -> Optional[str]:
+        """Extract a job description from raw page HTML, or None if none is found"""
+        
+        description = self._extract_description_from_page(self._parse_page(content))
+        return None if description == 'Job description not available' else description
+    
     def get_scraping_stats(self) -> Dict[str, Any]:
         """Get statistics about scraping session"""
         
@@ -1,29 +1,113 @@
 """
 Google Sheets tracking for job applications
 """
+import atexit
+import csv
+import itertools
 import logging
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+import time
+from typing import Dict, Iterator, List, Optional, Any, Tuple
+from datetime import datetime, timedelta
 from pathlib import Path
 
 try:
-    import gspread
-    from google.oauth2.service_account import Credentials
-    GSPREAD_AVAILABLE = True
+    import pandas as pd
+    PANDAS_AVAILABLE = True
 except ImportError:
-    GSPREAD_AVAILABLE = False
+    PANDAS_AVAILABLE = False
+
+import numpy as np
 
 from config import settings
+from utils._simd_kernels import summarize_scores
 
 logger = logging.getLogger(__name__)
 
+
+# Saved times are compared as integer seconds since the (naive, local) Unix epoch;
+# unparseable dates get the smallest int64 so they are never recent
+SAVED_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+_EPOCH = datetime(1970, 1, 1)
+_NO_TIME = np.iinfo(np.int64).min
+_SECOND = timedelta(seconds=1)
+
+def _frame_columns(records: List[Dict[str, Any]]) -> Tuple[Dict[Any, int], Dict[Any, int], np.ndarray, np.ndarray]:
+    """Status counts, category counts, fit scores and saved epoch seconds, computed column-wise with pandas"""
+    
+    df = pd.DataFrame.from_records(records)
+    
+    def column(name: str, default: Any) -> 'pd.Series':
+        # Same fallback as record.get(name, default) when a header is missing
+        if name in df.columns:
+            return df[name]
+        return pd.Series(default, index=df.index, dtype=object)
+    
+    status_counts = column('Status', 'unknown').value_counts(sort=False, dropna=False)
+    category_counts = column('Role Category', 'Unknown').value_counts(sort=False, dropna=False)
+    fit_scores = pd.to_numeric(column('Fit Score', ''), errors='coerce').dropna()
+    
+    # Duplicate timestamps are parsed once (cache=True); NaT becomes int64 min
+    saved = pd.to_datetime(column('Date Saved', '').astype(str), format=SAVED_DATE_FORMAT, errors='coerce', cache=True)
+    saved_times = saved.to_numpy(dtype='datetime64[s]').astype(np.int64)
+    
+    return (
+        {status: int(count) for status, count in status_counts.items()},
+        {category: int(count) for category, count in category_counts.items()},
+        fit_scores.to_numpy(dtype=np.float64, copy=True),
+        saved_times
+    )
+
+def _loop_columns(records: List[Dict[str, Any]]) -> Tuple[Dict[Any, int], Dict[Any, int], np.ndarray, np.ndarray]:
+    """Same as _frame_columns, one record at a time (used without pandas)"""
+    
+    status_counts = {}
+    category_counts = {}
+    fit_scores = []
+    saved_times = []
+    
+    for record in records:
+        # Status counts
+        status = record.get('Status', 'unknown')
+        status_counts[status] = status_counts.get(status, 0) + 1
+        
+        # Category counts
+        category = record.get('Role Category', 'Unknown')
+        category_counts[category] = category_counts.get(category, 0) + 1
+        
+        # Fit scores
+        fit_score = record.get('Fit Score', '')
+        if fit_score != '':  # 0.0 is a real score
+            try:
+                fit_scores.append(float(fit_score))
+            except ValueError:
+                pass
+        
+        # Saved time
+        try:
+            saved_times.append((datetime.strptime(str(record.get('Date Saved', '')), SAVED_DATE_FORMAT) - _EPOCH) // _SECOND)
+        except ValueError:
+            saved_times.append(_NO_TIME)
+    
+    return (
+        status_counts,
+        category_counts,
+        np.array(fit_scores, dtype=np.float64),
+        np.array(saved_times, dtype=np.int64)
+    )
+
+# Appended rows are buffered and sent in one append_rows call once this many are pending
+SHEETS_FLUSH_THRESHOLD = 25
+
+# Rows fetched per request when streaming the sheet
+RECORDS_PAGE_SIZE = 500
+
+# How long (seconds) a downloaded copy of the sheet is reused when nothing was written
+RECORDS_CACHE_TTL = 30
+
 class SheetsTracker:
     """Manages Google Sheets tracking for job applications"""
     
     def __init__(self):
-        if not GSPREAD_AVAILABLE:
-            raise ImportError("Google Sheets dependencies not available. Install: pip install gspread google-auth")
-        
         self.credentials_file = Path(settings.SHEETS_CREDENTIALS_FILE)
         self.sheet_name = settings.SHEETS_DOC_NAME
         self.worksheet_name = settings.SHEETS_WORKSHEET_NAME
@@ -38,6 +122,26 @@ class SheetsTracker:
             'Job Link', 'Fit Score', 'Date Saved', 'Status', 'Folder Path', 'Notes'
         ]
         
+        # 1-based sheet column of each header (gspread uses 1-based indexing)
+        self._col = {header: i + 1 for i, header in enumerate(self.headers)}
+        self._jobid_col = self._col['JobID']
+        self._status_col = self._col['Status']
+        self._notes_col = self._col['Notes']
+        
+        # Rows waiting for the next append_rows round-trip
+        self._pending_rows: List[List[str]] = []
+        self._flush_threshold = getattr(settings, "SHEETS_FLUSH_THRESHOLD", SHEETS_FLUSH_THRESHOLD)
+        
+        # Last get_all_records result; dropped whenever this tracker writes to the sheet
+        self._records_cache: Optional[List[Dict[str, Any]]] = None
+        self._cache_ts: float = 0
+        
+        # JobID -> sheet row number, built from the JobID column on first lookup
+        self._row_index: Optional[Dict[str, int]] = None
+        
+        # Status/notes cell writes waiting for flush_updates
+        self._pending_updates: List[Dict[str, Any]] = []
+        
         # Initialize connection
         self._initialize_sheets_connection()
         self._ensure_worksheet_exists()
@@ -45,6 +149,13 @@ class SheetsTracker:
     def _initialize_sheets_connection(self):
         """Initialize Google Sheets API connection"""
         
+        # Imported here so importing this module doesn't load gspread/google-auth
+        try:
+            import gspread
+            from google.oauth2.service_account import Credentials
+        except ImportError as e:
+            raise ImportError(f"Google Sheets dependencies not available ({e}). Install: pip install gspread google-auth") from e
+        
         if not self.credentials_file.exists():
             error_msg = f"Google Sheets credentials file not found: {self.credentials_file}"
             logger.error(error_msg)
@@ -75,6 +186,8 @@ class SheetsTracker:
     def _ensure_worksheet_exists(self):
         """Ensure the tracking spreadsheet and worksheet exist"""
         
+        import gspread
+        
         try:
             # Try to open existing spreadsheet
             try:
@@ -139,43 +252,90 @@ class SheetsTracker:
                    notes: str, folder_path: str) -> bool:
         """
         Append a job application record to the tracking sheet
-        Returns True if successful
+        Rows are buffered and written in batches (see flush)
+        Returns True once the row is queued; a failed batch write keeps the row queued for
+        retry, so call flush() to find out whether queued rows actually reached the sheet
         """
         
         try:
-            # Prepare row data
-            current_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            
-            # Format fit score
-            if isinstance(fit_score, (int, float)):
-                fit_score_str = f"{fit_score:.1f}"
-            else:
-                fit_score_str = str(fit_score) if fit_score else ""
-            
-            row_data = [
-                job_id,
-                title,
-                company,
-                category,
-                variation,
-                link,
-                fit_score_str,
-                current_date,
-                status,
-                folder_path,
-                notes
-            ]
+            self._pending_rows.append(self._build_row(job_id, title, company, category, variation,
+                                                      link, fit_score, status, notes, folder_path))
+            logger.info(f"Queued job for Google Sheets: {title} at {company}")
             
-            # Append the row
-            self.worksheet.append_row(row_data)
-            
-            logger.info(f"Successfully logged job to Google Sheets: {title} at {company}")
+            if len(self._pending_rows) >= self._flush_threshold:
+                # A failure is logged by flush() and reported by the next explicit flush()
+                self.flush()
             return True
             
         except Exception as e:
             logger.error(f"Error appending job to sheets: {e}")
             return False
     
+    def append_jobs(self, jobs: List[Dict[str, Any]]) -> bool:
+        """
+        Append several job records (dicts of append_job's arguments) in one request
+        Returns True if successful
+        """
+        
+        try:
+            for job in jobs:
+                self._pending_rows.append(self._build_row(**job))
+        except Exception as e:
+            logger.error(f"Error appending jobs to sheets: {e}")
+            return False
+        
+        return self.flush()
+    
+    def flush(self) -> bool:
+        """
+        Write all buffered rows with a single append_rows call
+        Returns True if successful (rows stay buffered on failure)
+        """
+        
+        if not self._pending_rows:
+            return True
+        
+        try:
+            # RAW matches append_row's default, so cells read back exactly as written
+            response = self.worksheet.append_rows(self._pending_rows, value_input_option='RAW')
+            self._invalidate_records()
+            self._index_appended_rows(self._pending_rows, response)
+            logger.info(f"Successfully logged {len(self._pending_rows)} jobs to Google Sheets")
+            self._pending_rows = []
+            return True
+        
+        except Exception as e:
+            logger.error(f"Error flushing jobs to sheets: {e}")
+            return False
+    
+    def _build_row(self, job_id: str, title: str, company: str, category: str,
+                   variation: str, link: str, fit_score: any, status: str,
+                   notes: str = "", folder_path: str = "") -> List[str]:
+        """Sheet row for a job record, in header order"""
+        
+        # Prepare row data
+        current_date = datetime.now().strftime(SAVED_DATE_FORMAT)
+        
+        # Format fit score
+        if isinstance(fit_score, (int, float)):
+            fit_score_str = f"{fit_score:.1f}"
+        else:
+            fit_score_str = str(fit_score) if fit_score else ""
+        
+        return [
+            job_id,
+            title,
+            company,
+            category,
+            variation,
+            link,
+            fit_score_str,
+            current_date,
+            status,
+            folder_path,
+            notes
+        ]
+    
     def update_job_status(self, job_id: str, new_status: str, notes: str = "") -> bool:
         """
         Update the status of an existing job record
@@ -183,46 +343,136 @@ class SheetsTracker:
         """
         
         try:
-            # Find the job by ID
-            job_id_column = self.headers.index('JobID') + 1  # gspread uses 1-based indexing
+            # Earlier queued changes go first so this one isn't overwritten
+            if not self.flush_updates():
+                return False
             
-            # Get all values in JobID column
-            job_ids = self.worksheet.col_values(job_id_column)
+            updates = self._status_updates(job_id, new_status, notes)
+            if updates is None:
+                logger.warning(f"Job ID not found for status update: {job_id}")
+                return False
             
-            # Find matching row
-            for i, existing_id in enumerate(job_ids):
-                if existing_id == job_id:
-                    row_number = i + 1
-                    
-                    # Update status and notes
-                    status_col = self.headers.index('Status') + 1
-                    notes_col = self.headers.index('Notes') + 1
-                    
-                    updates = [
-                        {
-                            'range': f'{chr(64 + status_col)}{row_number}',
-                            'values': [[new_status]]
-                        }
-                    ]
-                    
-                    if notes:
-                        updates.append({
-                            'range': f'{chr(64 + notes_col)}{row_number}',
-                            'values': [[notes]]
-                        })
-                    
-                    self.worksheet.batch_update(updates)
-                    
-                    logger.info(f"Updated job status: {job_id} -> {new_status}")
-                    return True
+            self.worksheet.batch_update(updates)
+            self._invalidate_records()
             
-            logger.warning(f"Job ID not found for status update: {job_id}")
-            return False
+            logger.info(f"Updated job status: {job_id} -> {new_status}")
+            return True
             
         except Exception as e:
             logger.error(f"Error updating job status: {e}")
             return False
     
+    def queue_status_update(self, job_id: str, new_status: str, notes: str = "") -> bool:
+        """
+        Queue a status update to be sent with the next flush_updates call
+        Returns True if the job was found and the update queued
+        """
+        
+        try:
+            updates = self._status_updates(job_id, new_status, notes)
+            if updates is None:
+                logger.warning(f"Job ID not found for status update: {job_id}")
+                return False
+            
+            self._pending_updates.extend(updates)
+            logger.info(f"Queued job status update: {job_id} -> {new_status}")
+            return True
+        
+        except Exception as e:
+            logger.error(f"Error queueing job status update: {e}")
+            return False
+    
+    def flush_updates(self) -> bool:
+        """
+        Send all queued status updates in a single values_batch_update call
+        Returns True if successful (updates stay queued on failure)
+        """
+        
+        if not self._pending_updates:
+            return True
+        
+        from gspread.utils import absolute_range_name
+        
+        try:
+            data = [
+                {'range': absolute_range_name(self.worksheet.title, update['range']), 'values': update['values']}
+                for update in self._pending_updates
+            ]
+            # RAW like the direct batch_update path
+            self.spreadsheet.values_batch_update({'valueInputOption': 'RAW', 'data': data})
+            self._invalidate_records()
+            
+            logger.info(f"Applied {len(self._pending_updates)} queued cell updates")
+            self._pending_updates = []
+            return True
+        
+        except Exception as e:
+            logger.error(f"Error flushing job status updates: {e}")
+            return False
+    
+    def _status_updates(self, job_id: str, new_status: str, notes: str) -> Optional[List[Dict[str, Any]]]:
+        """Cell updates setting a job's status (and notes), or None if the job isn't in the sheet"""
+        
+        from gspread.utils import rowcol_to_a1
+        
+        # The job may still be in the append buffer
+        self.flush()
+        
+        # Find the job by ID
+        row_number = self._find_job_row(job_id)
+        if row_number is None:
+            return None
+        
+        # Update status and notes
+        updates = [
+            {
+                'range': rowcol_to_a1(row_number, self._status_col),
+                'values': [[new_status]]
+            }
+        ]
+        
+        if notes:
+            updates.append({
+                'range': rowcol_to_a1(row_number, self._notes_col),
+                'values': [[notes]]
+            })
+        
+        return updates
+    
+    def _find_job_row(self, job_id: str) -> Optional[int]:
+        """Sheet row number (1-based) of the first row with job_id, or None"""
+        
+        if self._row_index is not None:
+            row_number = self._row_index.get(job_id)
+            if row_number is not None:
+                return row_number
+        
+        # No index yet, or an ID the index hasn't seen: rescan the JobID column once
+        self._row_index = {}
+        for i, existing_id in enumerate(self.worksheet.col_values(self._jobid_col)):
+            self._row_index.setdefault(existing_id, i + 1)
+        return self._row_index.get(job_id)
+    
+    def _index_appended_rows(self, rows: List[List[str]], response: Any):
+        """Record the row numbers of freshly appended rows from the append_rows response"""
+        
+        if self._row_index is None:
+            return
+        
+        from gspread.utils import a1_to_rowcol
+        
+        try:
+            updated_range = response['updates']['updatedRange']
+            start_row, _ = a1_to_rowcol(updated_range.split('!')[-1].split(':')[0])
+        except Exception:
+            # Can't tell where the rows landed; rebuild on the next lookup
+            self._row_index = None
+            return
+        
+        job_id_index = self._jobid_col - 1
+        for offset, row in enumerate(rows):
+            self._row_index.setdefault(row[job_id_index], start_row + offset)
+    
     def get_job_records(self, status_filter: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Get all job records, optionally filtered by status
@@ -230,14 +480,13 @@ class SheetsTracker:
         """
         
         try:
-            # Get all records
-            records = self.worksheet.get_all_records()
+            records = self._get_all_records()
             
-            # Convert to list of dicts and filter if needed
+            # Copy so callers can't modify the cached rows; filter if needed
             job_records = []
             for record in records:
                 if status_filter is None or record.get('Status') == status_filter:
-                    job_records.append(record)
+                    job_records.append(dict(record))
             
             logger.info(f"Retrieved {len(job_records)} job records from sheets")
             return job_records
@@ -246,6 +495,43 @@ class SheetsTracker:
             logger.error(f"Error retrieving job records: {e}")
             return []
     
+    def _get_all_records(self) -> List[Dict[str, Any]]:
+        """All sheet rows as dicts, reusing a recent download when nothing has been written since"""
+        
+        # Include rows and status changes still waiting to be sent
+        self.flush()
+        self.flush_updates()
+        
+        if self._records_cache is None or time.time() - self._cache_ts >= RECORDS_CACHE_TTL:
+            self._records_cache = self.worksheet.get_all_records()
+            self._cache_ts = time.time()
+        return self._records_cache
+    
+    def _invalidate_records(self):
+        """Forget the cached sheet contents after a write"""
+        self._records_cache = None
+    
+    def iter_job_records(self) -> Iterator[Dict[str, str]]:
+        """Yield every job row as a header -> cell text dict, fetching the sheet page by page"""
+        
+        from gspread.utils import rowcol_to_a1
+        
+        # Include rows and status changes still waiting to be sent
+        self.flush()
+        self.flush_updates()
+        
+        start_row = 2  # row 1 holds the headers
+        while True:
+            end_row = start_row + RECORDS_PAGE_SIZE - 1
+            rows = self.worksheet.get(f"A{start_row}:{rowcol_to_a1(end_row, len(self.headers))}")
+            for row in rows:
+                yield dict(zip(self.headers, row))
+            
+            # The API trims trailing empty rows, so a short page is the last one
+            if len(rows) < RECORDS_PAGE_SIZE:
+                return
+            start_row = end_row + 1
+    
     def get_application_stats(self) -> Dict[str, Any]:
         """Get statistics about tracked applications"""
         
@@ -261,43 +547,19 @@ class SheetsTracker:
                     'recent_applications': 0
                 }
             
-            # Count by status
-            status_counts = {}
-            category_counts = {}
-            fit_scores = []
+            columns = _frame_columns if PANDAS_AVAILABLE else _loop_columns
+            status_counts, category_counts, fit_scores, saved_times = columns(records)
             
             # Count recent applications (last 7 days)
-            recent_count = 0
-            cutoff_date = (datetime.now() - datetime.timedelta(days=7)).strftime("%Y-%m-%d")
-            
-            for record in records:
-                # Status counts
-                status = record.get('Status', 'unknown')
-                status_counts[status] = status_counts.get(status, 0) + 1
-                
-                # Category counts
-                category = record.get('Role Category', 'Unknown')
-                category_counts[category] = category_counts.get(category, 0) + 1
-                
-                # Fit scores
-                fit_score = record.get('Fit Score', '')
-                if fit_score and fit_score != '':
-                    try:
-                        fit_scores.append(float(fit_score))
-                    except ValueError:
-                        pass
-                
-                # Recent applications
-                date_saved = record.get('Date Saved', '')
-                if date_saved and date_saved.split()[0] >= cutoff_date:
-                    recent_count += 1
+            cutoff_ts = (datetime.now() - timedelta(days=7) - _EPOCH) // _SECOND
+            average_fit_score, recent_count = summarize_scores(fit_scores, saved_times, cutoff_ts)
             
             return {
                 'total_jobs': len(records),
                 'by_status': status_counts,
                 'by_category': category_counts,
-                'average_fit_score': sum(fit_scores) / len(fit_scores) if fit_scores else 0,
-                'recent_applications': recent_count
+                'average_fit_score': float(average_fit_score),
+                'recent_applications': int(recent_count)
             }
             
         except Exception as e:
@@ -336,15 +598,17 @@ class SheetsTracker:
                 status="test",
                 notes="Validation test",
                 folder_path="/test/path"
-            )
+            ) and self.flush()
             
             if success:
                 # Remove the test row
                 try:
-                    records = self.worksheet.get_all_records()
+                    records = self._get_all_records()
                     for i, record in enumerate(records):
                         if record.get('JobID') == test_job_id:
                             self.worksheet.delete_rows(i + 2)  # +2 because headers are row 1
+                            self._invalidate_records()
+                            self._row_index = None  # later rows moved up
                             break
                 except Exception:
                     pass  # If deletion fails, that's ok for validation
@@ -367,26 +631,36 @@ class SheetsTracker:
         """Export tracking data to CSV file"""
         
         try:
-            records = self.get_job_records()
+            records = self.iter_job_records()
+            first = next(records, None)
             
-            if not records:
+            if first is None:
                 logger.warning("No records to export")
                 return False
             
-            import csv
-            
+            exported = 0
+            records = itertools.chain((first,), records)
             with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=self.headers)
-                writer.writeheader()
-                
-                for record in records:
-                    # Ensure all headers are present
-                    row = {}
-                    for header in self.headers:
-                        row[header] = record.get(header, '')
-                    writer.writerow(row)
-            
-            logger.info(f"Exported {len(records)} records to {output_path}")
+                if PANDAS_AVAILABLE:
+                    # One DataFrame per page keeps memory flat; missing trailing cells are written as ''
+                    while True:
+                        page = list(itertools.islice(records, RECORDS_PAGE_SIZE))
+                        if not page:
+                            break
+                        pd.DataFrame(page, columns=self.headers).to_csv(
+                            f, index=False, header=exported == 0, lineterminator='\r\n'
+                        )
+                        exported += len(page)
+                else:
+                    # Missing trailing cells are written as '' (DictWriter restval)
+                    writer = csv.DictWriter(f, fieldnames=self.headers)
+                    writer.writeheader()
+                    
+                    for record in records:
+                        writer.writerow(record)
+                        exported += 1
+            
+            logger.info(f"Exported {exported} records to {output_path}")
             return True
             
         except Exception as e:
@@ -408,6 +682,9 @@ def get_global_sheets_tracker() -> SheetsTracker:
     global _global_sheets_tracker
     if _global_sheets_tracker is None:
         _global_sheets_tracker = create_sheets_tracker()
+        # Don't lose buffered rows or status changes when the process ends between flushes
+        atexit.register(_global_sheets_tracker.flush_updates)
+        atexit.register(_global_sheets_tracker.flush)
     return _global_sheets_tracker
 
 
@@ -420,9 +697,11 @@ def log_job_application(job_id: str, title: str, company: str, category: str,
     return tracker.append_job(job_id, title, company, category, variation,
                             link, fit_score, status, notes, folder_path)
 
-def update_application_status(job_id: str, new_status: str, notes: str = "") -> bool:
-    """Quick function to update application status"""
+def update_application_status(job_id: str, new_status: str, notes: str = "", batch: bool = False) -> bool:
+    """Quick function to update application status (batch=True queues it until flush_updates)"""
     tracker = get_global_sheets_tracker()
+    if batch:
+        return tracker.queue_status_update(job_id, new_status, notes)
     return tracker.update_job_status(job_id, new_status, notes)
 
 def get_application_statistics() -> Dict[str, Any]: